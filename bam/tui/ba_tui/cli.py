@@ -1,6 +1,7 @@
 from __future__ import annotations
 
 import argparse
+import asyncio
 import json
 import sys
 from pathlib import Path
@@ -81,7 +82,7 @@ def run_init(args: argparse.Namespace) -> int:
         data_enabled=bool(defaults.get("data_enabled", True)),
         initial_data=defaults,
     )
-    result = app.run()
+    result = _run_tui(app)
     if result is None or result.get("action") != "init":
         emit({"status": "cancelled"})
         return 1
@@ -233,7 +234,7 @@ def run_log(args: argparse.Namespace) -> int:
         worklog_entries=None,  # Legacy parameter, not used anymore
         task_types=task_types,
     )
-    result = app.run()
+    result = _run_tui(app)
     if result is None or result.get("action") != "log":
         emit({"status": "cancelled"})
         return 1
@@ -257,7 +258,7 @@ def run_idea(args: argparse.Namespace) -> int:
         recent_entries=recent,
         idea_title=args.title or "",
     )
-    result = app.run()
+    result = _run_tui(app)
     if result is None or result.get("action") != "idea":
         emit({"status": "cancelled"})
         return 1
@@ -313,7 +314,7 @@ def run_artifact(args: argparse.Namespace) -> int:
         recent_entries=recent,
         artifacts=manifest.artifacts,
     )
-    result = app.run()
+    result = _run_tui(app)
     if result is None or result.get("action") != "artifact":
         emit({"status": "cancelled"})
         return 1
@@ -345,7 +346,7 @@ def run_manifest(args: argparse.Namespace) -> int:
         recent_entries=recent,
         manifest=manifest,
     )
-    result = app.run()
+    result = _run_tui(app)
     if result is None or result.get("action") != "manifest":
         emit({"status": "cancelled"})
         return 1
@@ -550,7 +551,7 @@ def run_menu(args: argparse.Namespace) -> int:
         data_enabled=bool(defaults.get("data_enabled", True)),
         initial_data=defaults,
     )
-    result = app.run()
+    result = _run_tui(app)
 
     if result is None:
         emit({"status": "cancelled"})
@@ -926,6 +927,21 @@ Exit codes:
     return parser
 
 
+def _install_uvloop() -> None:
+    """Switch asyncio to uvloop when the optional dependency is installed."""
+    try:
+        import uvloop
+    except ImportError:
+        return
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+
+def _run_tui(app: BAApp) -> Any:
+    """Run ``app``; only TUI commands pay for installing uvloop."""
+    _install_uvloop()
+    return app.run()
+
+
 def main() -> None:
     parser = build_parser()
     args = parser.parse_args()
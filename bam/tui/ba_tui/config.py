@@ -1,12 +1,44 @@
 from __future__ import annotations
 
+import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
 import yaml
 
+try:
+    from yaml import CSafeDumper as SafeDumper
+    from yaml import CSafeLoader as SafeLoader
+except ImportError:  # PyYAML built without libyaml
+    from yaml import SafeDumper, SafeLoader
+
 # Cache for loaded configuration
 _config_cache: dict[str, Any] | None = None
+# Normalized select options, tagged with the config dict they were built from
+_options_cache: dict[tuple[str, bool], tuple[dict[str, Any], list[tuple[str, str]]]] = {}
+# Labelled data format options, tagged the same way
+_format_options_cache: tuple[dict[str, Any], list[tuple[str, str]]] | None = None
+
+
+@lru_cache(maxsize=32)
+def _parse_yaml_cached(path: str, mtime_ns: int, size: int) -> Any:
+    with open(path) as f:
+        # JSON is a YAML subset; the json parser is much faster for it
+        if path.endswith(".json"):
+            return json.load(f)
+        return yaml.load(f, Loader=SafeLoader)
+
+
+def load_yaml_cached(path: Path) -> Any:
+    """Parse a YAML (or JSON) file, reusing the result while it is unchanged.
+
+    Results are keyed on (path, mtime, size), so an unmodified file is only
+    parsed once per process. The returned object is shared between callers
+    and must not be mutated.
+    """
+    stat = path.stat()
+    return _parse_yaml_cached(str(path), stat.st_mtime_ns, stat.st_size)
 
 
 def load_config(project_root: Path | None = None) -> dict[str, Any]:
@@ -30,7 +62,7 @@ def load_config(project_root: Path | None = None) -> dict[str, Any]:
     if defaults_path.exists():
         try:
             with open(defaults_path) as f:
-                config = yaml.safe_load(f) or {}
+                config = yaml.load(f, Loader=SafeLoader) or {}
         except Exception:
             pass
 
@@ -39,7 +71,7 @@ def load_config(project_root: Path | None = None) -> dict[str, Any]:
     if system_config_path.exists():
         try:
             with open(system_config_path) as f:
-                system_config = yaml.safe_load(f) or {}
+                system_config = yaml.load(f, Loader=SafeLoader) or {}
                 config.update(system_config)
         except Exception:
             pass
@@ -50,7 +82,7 @@ def load_config(project_root: Path | None = None) -> dict[str, Any]:
         if project_config_path.exists():
             try:
                 with open(project_config_path) as f:
-                    project_config = yaml.safe_load(f) or {}
+                    project_config = yaml.load(f, Loader=SafeLoader) or {}
                     config.update(project_config)
             except Exception:
                 pass
@@ -71,8 +103,16 @@ def get_config_options(
     """Convert config list to select options format.
 
     Handles both simple lists (strings) and dict format with label/value.
+    The result is cached while the loaded config is unchanged and shared
+    between callers, so it must not be mutated.
     """
-    items = get_config_list(key, project_root)
+    config = load_config(project_root)
+    cache_key = (key, add_other)
+    cached = _options_cache.get(cache_key)
+    if cached is not None and cached[0] is config:
+        return cached[1]
+
+    items = config.get(key, [])
     options = []
 
     for item in items:
@@ -86,6 +126,7 @@ def get_config_options(
     if add_other and not any(v.lower() == "other" for _, v in options):
         options.append(("Other", "Other"))
 
+    _options_cache[cache_key] = (config, options)
     return options
 
 
@@ -108,8 +149,18 @@ def load_endpoint_options(project_root: Path | None = None) -> list[tuple[str, s
 def load_dataset_format_options(
     project_root: Path | None = None,
 ) -> list[tuple[str, str]]:
-    """Load data format options."""
-    items = get_config_list("data_formats", project_root)
+    """Load data format options.
+
+    Cached like get_config_options; the returned list must not be mutated.
+    """
+    global _format_options_cache
+
+    config = load_config(project_root)
+    cached = _format_options_cache
+    if cached is not None and cached[0] is config:
+        return cached[1]
+
+    items = config.get("data_formats", [])
     options = []
     for name in items:
         if name == "ome-tiff":
@@ -119,6 +170,7 @@ def load_dataset_format_options(
         else:
             label = name.upper()
         options.append((label, name))
+    _format_options_cache = (config, options)
     return options
 
 
@@ -0,0 +1,78 @@
+"""Optional OS-level change notifications for a single watched file."""
+
+from __future__ import annotations
+
+import os
+from pathlib import Path
+from typing import Callable
+
+try:  # optional dependency, see the ``fast`` extra
+    from watchdog.events import FileSystemEventHandler
+    from watchdog.observers import Observer
+except ImportError:
+    FileSystemEventHandler = object  # type: ignore
+    Observer = None
+
+
+class _FileChangeHandler(FileSystemEventHandler):  # type: ignore
+    def __init__(self, target: str, callback: Callable[[], None]) -> None:
+        super().__init__()
+        self.target = target
+        self.callback = callback
+
+    def on_any_event(self, event: object) -> None:
+        # Editors that save atomically rename a temp file over the target
+        paths = (getattr(event, "src_path", ""), getattr(event, "dest_path", ""))
+        if self.target in (os.fsdecode(p) for p in paths if p):
+            self.callback()
+
+
+class FileWatcher:
+    """Call ``callback`` from a watcher thread whenever one file changes.
+
+    The parent directory is watched so delete-and-rename saves are seen.
+    ``available`` is False when watchdog is not installed; callers keep
+    polling in that case.
+    """
+
+    available = Observer is not None
+
+    def __init__(self, callback: Callable[[], None]) -> None:
+        self._callback = callback
+        self._observer = None
+        self._path = ""
+
+    def watch(self, path: str | Path) -> bool:
+        """Start watching ``path`` instead of the previous file."""
+        if not self.available:
+            return False
+        target = str(Path(path).resolve())
+        if target == self._path:
+            return True
+        try:
+            if self._observer is None:
+                self._observer = Observer()
+                self._observer.daemon = True
+                self._observer.start()
+            self._observer.unschedule_all()
+            self._observer.schedule(
+                _FileChangeHandler(target, self._callback),
+                str(Path(target).parent),
+                recursive=False,
+            )
+        except Exception:
+            self._path = ""
+            return False
+        self._path = target
+        return True
+
+    def stop(self) -> None:
+        if self._observer is None:
+            return
+        try:
+            self._observer.stop()
+            self._observer.join(timeout=1)
+        except Exception:
+            pass
+        self._observer = None
+        self._path = ""
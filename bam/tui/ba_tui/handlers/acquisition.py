@@ -4,7 +4,14 @@ from typing import Optional
 
 from textual.widgets import DataTable, TabbedContent
 
-from ..screens import AcquisitionSessionModal, ChannelModal
+from .. import screens
+from ..widgets import sync_table_rows, table_cells
+
+# Row keys shown in the channels table, in column order
+_CHANNEL_COLUMNS = ("name", "fluorophore", "excitation_nm", "emission_nm")
+# Channel fields saved as text, and as whole numbers of nanometres
+_CHANNEL_TEXT_FIELDS = ("fluorophore",)
+_CHANNEL_NM_FIELDS = ("excitation_nm", "emission_nm")
 
 
 class AcquisitionMixin:
@@ -18,47 +25,41 @@ class AcquisitionMixin:
         """Populate the DataTable with channel data."""
         try:
             table = self.query_one("#channels_table", DataTable)
-            if not table.columns:
-                table.add_column("Name", width=15)
-                table.add_column("Fluorophore", width=15)
-                table.add_column("Ex (nm)", width=10)
-                table.add_column("Em (nm)", width=10)
-            table.clear()
-            for idx, row in enumerate(self._channel_rows):
-                table.add_row(
-                    row.get("name", ""),
-                    row.get("fluorophore", ""),
-                    row.get("excitation_nm", ""),
-                    row.get("emission_nm", ""),
-                    key=str(idx),
-                )
+            sync_table_rows(
+                table,
+                table_cells(self._channel_rows, _CHANNEL_COLUMNS),
+                (("Name", 15), ("Fluorophore", 15), ("Ex (nm)", 10), ("Em (nm)", 10)),
+            )
         except Exception:
             pass
 
     def _populate_acquisition_table(self) -> None:
         try:
             table = self.query_one("#acquisition_table", DataTable)
-            table.clear(columns=True)
-            table.add_columns(
-                "Date",
-                "Microscope",
-                "Modality",
-                "Objective",
-                "Voxel",
-                "Time (s)",
-                "Notes",
+            sync_table_rows(
+                table,
+                [
+                    (
+                        self._format_date_cell(row.get("imaging_date")),
+                        str(row.get("microscope", "")),
+                        str(row.get("modality", "")),
+                        str(row.get("objective", "")),
+                        self._format_voxel(row),
+                        str(row.get("time_interval_s", "")),
+                        self._truncate_text(str(row.get("notes", ""))),
+                    )
+                    for row in self._acquisition_rows
+                ],
+                (
+                    "Date",
+                    "Microscope",
+                    "Modality",
+                    "Objective",
+                    "Voxel",
+                    "Time (s)",
+                    "Notes",
+                ),
             )
-            for idx, row in enumerate(self._acquisition_rows):
-                table.add_row(
-                    self._format_date_cell(row.get("imaging_date")),
-                    str(row.get("microscope", "")),
-                    str(row.get("modality", "")),
-                    str(row.get("objective", "")),
-                    self._format_voxel(row),
-                    str(row.get("time_interval_s", "")),
-                    self._truncate_text(str(row.get("notes", ""))),
-                    key=str(idx),
-                )
         except Exception:
             pass
 
@@ -129,7 +130,7 @@ class AcquisitionMixin:
         return f"{x} x {y} x {z}"
 
     def action_add_acquisition(self) -> None:
-        if self.query_one("#tabs", TabbedContent).active != "science":
+        if self._main_tabs().active != "science":
             return
         if (
             self.query_one("#science_sections", TabbedContent).active
@@ -139,7 +140,7 @@ class AcquisitionMixin:
         self._store_channels_for_selected_session()
         # Always use None for new acquisition (no pre-filled data)
         self.push_screen(
-            AcquisitionSessionModal(None),
+            screens.AcquisitionSessionModal(None),
             self._handle_new_acquisition,
         )
 
@@ -215,12 +216,12 @@ class AcquisitionMixin:
 
     def action_add_channel_row(self) -> None:
         """Action to add a new channel row."""
-        if self.query_one("#tabs", TabbedContent).active != "science":
+        if self._main_tabs().active != "science":
             return
         if not self._acquisition_rows:
             self.notify("Add an imaging session first", severity="warning")
             return
-        self.push_screen(ChannelModal(), self._handle_new_channel)
+        self.push_screen(screens.ChannelModal(), self._handle_new_channel)
 
     def _handle_new_channel(self, data: dict[str, str] | None) -> None:
         """Add new channel after modal close."""
@@ -267,15 +268,15 @@ class AcquisitionMixin:
             if not name:
                 continue
             channel: dict[str, object] = {"name": name}
-            fluorophore = row.get("fluorophore", "").strip()
-            if fluorophore:
-                channel["fluorophore"] = fluorophore
-            ex_nm = row.get("excitation_nm", "").strip()
-            if ex_nm and ex_nm.isdigit():
-                channel["excitation_nm"] = int(ex_nm)
-            em_nm = row.get("emission_nm", "").strip()
-            if em_nm and em_nm.isdigit():
-                channel["emission_nm"] = int(em_nm)
+            for field in _CHANNEL_TEXT_FIELDS:
+                value = row.get(field, "").strip()
+                if value:
+                    channel[field] = value
+            for field in _CHANNEL_NM_FIELDS:
+                # isdigit() is False for "", so blanks are skipped too
+                value = row.get(field, "").strip()
+                if value.isdigit():
+                    channel[field] = int(value)
             channels.append(channel)
         return channels
 
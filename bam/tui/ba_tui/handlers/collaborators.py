@@ -4,12 +4,16 @@ from typing import TYPE_CHECKING
 
 from textual.widgets import DataTable, Input, Select
 
+from .. import screens
 from ..config import load_role_options
-from ..screens import CollaboratorModal
+from ..widgets import sync_table_rows, table_cells, update_table_row
 
 if TYPE_CHECKING:
     from ..tui import BAApp
 
+# Row keys shown in the collaborators table, in column order
+_COLLABORATOR_COLUMNS = ("name", "role", "email", "affiliation")
+
 
 class CollaboratorsMixin:
     """Mixin for collaborator table management."""
@@ -25,7 +29,7 @@ class CollaboratorsMixin:
             return
         if data and 0 <= idx < len(self._collaborator_rows):
             self._collaborator_rows[idx] = data
-            self._populate_collaborators_table()
+            self._refresh_collaborator_row(idx)
 
     def _collect_collaborators(self: "BAApp") -> list[dict[str, str]]:
         collaborators = []
@@ -56,32 +60,38 @@ class CollaboratorsMixin:
         """Populate the DataTable with collaborator data."""
         try:
             table = self.query_one("#collaborators_table", DataTable)
-            if not table.columns:
-                # Add columns with proportional widths
-                table.add_column("Name", width=20)
-                table.add_column("Role", width=15)
-                table.add_column("Email", width=25)
-                table.add_column("Affiliation", width=20)
-            table.clear()
-            for idx, row in enumerate(self._collaborator_rows):
-                table.add_row(
-                    row.get("name", ""),
-                    row.get("role", ""),
-                    row.get("email", ""),
-                    row.get("affiliation", ""),
-                    key=str(idx),
-                )
+            sync_table_rows(
+                table,
+                table_cells(self._collaborator_rows, _COLLABORATOR_COLUMNS),
+                # Columns with proportional widths
+                (("Name", 20), ("Role", 15), ("Email", 25), ("Affiliation", 20)),
+            )
+        except Exception:
+            pass
+
+    def _refresh_collaborator_row(self: "BAApp", idx: int) -> None:
+        """Redraw only row ``idx`` after it was edited in place."""
+        try:
+            table = self.query_one("#collaborators_table", DataTable)
+            if table.row_count != len(self._collaborator_rows):
+                self._populate_collaborators_table()
+                return
+            (cells,) = table_cells(
+                [self._collaborator_rows[idx]], _COLLABORATOR_COLUMNS
+            )
+            update_table_row(table, idx, cells)
         except Exception:
             pass
 
     def action_add_collaborator_row(self: "BAApp") -> None:
         """Action to add a new collaborator row (Ctrl+A)."""
         # Always allow adding, even if table not focused (as long as we are in setup tab)
-        if self.query_one("#tabs").active != "setup":
+        if self._main_tabs().active != "setup":
             return
 
         self.push_screen(
-            CollaboratorModal(load_role_options()), self._handle_new_collaborator
+            screens.CollaboratorModal(load_role_options()),
+            self._handle_new_collaborator,
         )
 
     def _handle_new_collaborator(self: "BAApp", data: dict[str, str] | None) -> None:
@@ -95,7 +105,7 @@ class CollaboratorsMixin:
         try:
             table = self.query_one("#collaborators_table", DataTable)
             # Only remove if table is focused or active
-            if not table.has_focus and self.query_one("#tabs").active != "setup":
+            if not table.has_focus and self._main_tabs().active != "setup":
                 return
 
             if table.cursor_row is None:
@@ -173,7 +183,7 @@ class CollaboratorsMixin:
                 "email": email,
                 "affiliation": affiliation,
             }
-            self._populate_collaborators_table()
+            self._refresh_collaborator_row(idx)
         except Exception:
             pass
 
@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 from textual.containers import Vertical
-from textual.widgets import DataTable, TabbedContent
+from textual.widgets import DataTable
 
 from typing import TYPE_CHECKING
 
+from .. import screens
 from ..config import load_dataset_format_options, load_endpoint_options
-from ..screens import DatasetModal
+from ..widgets import sync_table_rows
 
 if TYPE_CHECKING:
     from ..tui import BAApp
@@ -36,27 +37,22 @@ class DatasetsMixin:
     def _populate_datasets_table(self: "BAApp") -> None:
         try:
             table = self.query_one("#datasets_table", DataTable)
-            table.clear(columns=True)
-            table.add_columns(
-                "Name",
-                "Endpoint",
-                "Source",
-                "Local",
-                "Format",
-                "Quality",
-                "Size",
+            sync_table_rows(
+                table,
+                [
+                    (
+                        str(row.get("name", "")),
+                        str(row.get("endpoint", "")),
+                        self._truncate_path(str(row.get("source", ""))),
+                        self._truncate_path(str(row.get("local", ""))),
+                        str(row.get("format", "")),
+                        str(row.get("image_quality", "")),
+                        self._format_dataset_size(row),
+                    )
+                    for row in self._dataset_rows
+                ],
+                ("Name", "Endpoint", "Source", "Local", "Format", "Quality", "Size"),
             )
-            for idx, row in enumerate(self._dataset_rows):
-                table.add_row(
-                    str(row.get("name", "")),
-                    str(row.get("endpoint", "")),
-                    self._truncate_path(str(row.get("source", ""))),
-                    self._truncate_path(str(row.get("local", ""))),
-                    str(row.get("format", "")),
-                    str(row.get("image_quality", "")),
-                    self._format_dataset_size(row),
-                    key=str(idx),
-                )
         except Exception:
             pass
 
@@ -74,7 +70,7 @@ class DatasetsMixin:
         return f"...{value[-(max_len - 3) :]}"
 
     def action_add_dataset(self: "BAApp") -> None:
-        tabbed = self.query_one("#tabs", TabbedContent)
+        tabbed = self._main_tabs()
         if tabbed.active != "setup":
             return
         initial_data = None
@@ -87,7 +83,7 @@ class DatasetsMixin:
         except Exception:
             initial_data = None
         self.push_screen(
-            DatasetModal(
+            screens.DatasetModal(
                 load_endpoint_options(),
                 load_dataset_format_options(),
                 initial_data,
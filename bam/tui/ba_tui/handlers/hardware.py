@@ -2,8 +2,12 @@ from __future__ import annotations
 
 from textual.widgets import DataTable
 
-from ..screens import HardwareModal
+from .. import screens
 from ..utils import detect_hardware
+from ..widgets import sync_table_rows, table_cells
+
+# Row keys shown in the hardware table, in column order (GPU count is derived)
+_HARDWARE_COLUMNS = ("name", "cpu", "cores", "ram", "gpu")
 
 
 class HardwareMixin:
@@ -26,25 +30,19 @@ class HardwareMixin:
     def _populate_hardware_table(self) -> None:
         try:
             table = self.query_one("#hardware_table", DataTable)
-            table.clear(columns=True)
-            table.add_columns("Name", "CPU", "Cores", "RAM", "GPU", "GPU Count")
-            for idx, row in enumerate(self._hardware_profiles):
+            cells = table_cells(self._hardware_profiles, _HARDWARE_COLUMNS)
+            rows = []
+            for row, base in zip(self._hardware_profiles, cells):
                 gpu_count = row.get("gpu_count", 0)
-                gpu_count_str = str(gpu_count) if gpu_count > 0 else ""
-                table.add_row(
-                    row.get("name", ""),
-                    row.get("cpu", ""),
-                    row.get("cores", ""),
-                    row.get("ram", ""),
-                    row.get("gpu", ""),
-                    gpu_count_str,
-                    key=str(idx),
-                )
+                rows.append(base + (str(gpu_count) if gpu_count > 0 else "",))
+            sync_table_rows(
+                table, rows, ("Name", "CPU", "Cores", "RAM", "GPU", "GPU Count")
+            )
         except Exception:
             pass
 
     def _add_hardware_profile(self) -> None:
-        self.push_screen(HardwareModal(), self._handle_new_hardware)
+        self.push_screen(screens.HardwareModal(), self._handle_new_hardware)
 
     def _handle_new_hardware(self, data: dict[str, str | bool] | None) -> None:
         if data:
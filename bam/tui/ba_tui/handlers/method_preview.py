@@ -1,14 +1,65 @@
 from __future__ import annotations
 
+import asyncio
+import os
+import stat
+import time
+from functools import partial
 from pathlib import Path
 from typing import TYPE_CHECKING, Optional
 
-from textual.widgets import Input, Markdown, OptionList
+from textual.css.query import NoMatches
+from textual.timer import Timer
+from textual.widgets import Input, Markdown, OptionList, TabbedContent
 from textual.widgets.option_list import Option
 
+from ..file_watch import FileWatcher
+from ..path_trie import suggest_paths_async
+
 if TYPE_CHECKING:
     from ..tui import BAApp
 
+# Editors can rewrite a file many times per second; re-render at most this often
+_PREVIEW_RENDER_INTERVAL_S = 0.5
+# Larger method files are only previewed up to this many bytes
+_PREVIEW_MAX_BYTES = 1 << 20
+
+
+def _stat_signature(path: str | Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _read_preview(path: str | Path) -> tuple[str, tuple[int, int]]:
+    """Read at most ``_PREVIEW_MAX_BYTES`` of ``path``.
+
+    Returns the decoded text and the ``(mtime_ns, size)`` signature of the
+    descriptor it came from.
+    """
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        st = os.fstat(fd)
+        data = os.read(fd, _PREVIEW_MAX_BYTES)
+    finally:
+        os.close(fd)
+    text = data.decode("utf-8", errors="replace")
+    if st.st_size > _PREVIEW_MAX_BYTES:
+        text += "\n\n*Preview truncated.*\n"
+    return text, (st.st_mtime_ns, st.st_size)
+
+
+def _read_preview_if_changed(
+    path: str, known: tuple[int, int] | None
+) -> tuple[str, tuple[int, int]] | None:
+    """:func:`_read_preview`, or None for non-files and unchanged signatures."""
+    st = os.stat(path)
+    if not stat.S_ISREG(st.st_mode) or (st.st_mtime_ns, st.st_size) == known:
+        return None
+    return _read_preview(path)
+
 
 class MethodPreviewMixin:
     """Mixin for method preview and path suggestions."""
@@ -17,14 +68,31 @@ class MethodPreviewMixin:
     _method_path: str
     _method_path_suggestions: Optional[OptionList]
     _method_path_suggestions_visible: bool
+    _method_path_input: Optional[Input]
+    _method_preview_markdown: Optional[Markdown]
     _method_preview_path: str
-    _method_preview_mtime: float | None
+    _method_preview_stat: tuple[int, int] | None
+    _method_preview_text: Optional[str]
+    _method_preview_visible: bool
+    _method_preview_debounce: Optional[Timer]
+    _method_preview_watcher: FileWatcher
+    _method_preview_watched: bool
+    _method_preview_flush: Optional[Timer]
+    _method_preview_last_render: float
     _method_template_used: str
     _project_root: Path
 
+    def _method_path_widget(self: "BAApp") -> Input:
+        return self._method_path_input or self.query_one("#method_path", Input)
+
+    def _method_preview_widget(self: "BAApp") -> Markdown:
+        return self._method_preview_markdown or self.query_one(
+            "#method_preview", Markdown
+        )
+
     def _create_method_template(self: "BAApp") -> None:
         try:
-            path_input = self.query_one("#method_path", Input)
+            path_input = self._method_path_widget()
             method_path = path_input.value.strip() or str(
                 self._project_root / "method.md"
             )
@@ -58,98 +126,186 @@ class MethodPreviewMixin:
 
     def _load_method_preview(self: "BAApp") -> None:
         try:
-            path = self.query_one("#method_path", Input).value.strip()
+            path = self._method_path_widget().value.strip()
             if not path:
                 return
-            method_path = Path(path).expanduser()
-            text = method_path.read_text()
-            self.query_one("#method_preview", Markdown).update(text)
-            self._method_preview_path = str(method_path)
-            try:
-                self._method_preview_mtime = method_path.stat().st_mtime
-            except Exception:
-                self._method_preview_mtime = None
-        except Exception:
+            self._queue_method_preview(str(Path(path).expanduser()), None)
+        except (NoMatches, RuntimeError):
             pass
 
     def _load_method_preview_if_exists(self: "BAApp", path: str) -> None:
         try:
-            method_path = Path(path).expanduser()
-            if method_path.is_file():
-                text = method_path.read_text()
-                self.query_one("#method_preview", Markdown).update(text)
-                self._method_preview_path = str(method_path)
-                try:
-                    self._method_preview_mtime = method_path.stat().st_mtime
-                except Exception:
-                    self._method_preview_mtime = None
-        except Exception:
-            pass
+            method_path = str(Path(path).expanduser())
+        except RuntimeError:
+            return
+        known = (
+            self._method_preview_stat
+            if method_path == self._method_preview_path
+            else None
+        )
+        self._queue_method_preview(method_path, known)
+
+    def _queue_method_preview(
+        self: "BAApp", path: str, known: tuple[int, int] | None
+    ) -> None:
+        """Read ``path`` on a worker thread, then show it.
+
+        A newer request cancels one that is still reading, so slow mounts
+        never stall the UI or stack up reads.
+        """
+        self.run_worker(
+            self._read_method_preview(path, known, reload=False),
+            exclusive=True,
+            group="method_preview",
+        )
+
+    async def _read_method_preview(
+        self: "BAApp", path: str, known: tuple[int, int] | None, reload: bool
+    ) -> None:
+        try:
+            result = await asyncio.to_thread(_read_preview_if_changed, path, known)
+        except (OSError, ValueError):
+            return
+        # A reload of a file the user has since navigated away from is stale
+        if result is None or (reload and path != self._method_preview_path):
+            return
+        try:
+            self._show_method_preview(path, *result)
+        except NoMatches:
+            # The preview pane was torn down while the file was being read
+            return
+        if not reload:
+            self._watch_method_preview()
+
+    def _show_method_preview(
+        self: "BAApp",
+        path: str,
+        text: str,
+        signature: tuple[int, int],
+    ) -> None:
+        """Render ``text`` unless the same content is already on screen.
+
+        Editors often touch the mtime without changing the bytes; comparing
+        the text is far cheaper than the Markdown re-parse it skips.
+        """
+        if path != self._method_preview_path or text != self._method_preview_text:
+            self._method_preview_widget().update(text)
+            self._method_preview_text = text
+        self._method_preview_path = path
+        self._method_preview_stat = signature
+
+    def _schedule_method_preview(self: "BAApp", path: str) -> None:
+        """Load the preview once typing in the method path pauses.
+
+        The current preview stays on screen until then.
+        """
+        if self._method_preview_debounce is not None:
+            self._method_preview_debounce.stop()
+        self._method_preview_debounce = self.set_timer(
+            0.2, partial(self._load_method_preview_if_exists, path)
+        )
 
     def _poll_method_preview(self: "BAApp") -> None:
-        if not self._method_preview_path:
+        """Re-render the preview if the file changed.
+
+        The first change renders immediately; further changes within
+        ``_PREVIEW_RENDER_INTERVAL_S`` are coalesced into one trailing reload.
+        """
+        if not self._method_preview_path or self._method_preview_flush is not None:
+            return
+        signature = _stat_signature(self._method_preview_path)
+        if signature is None or signature == self._method_preview_stat:
+            return
+        wait = _PREVIEW_RENDER_INTERVAL_S - (
+            time.monotonic() - self._method_preview_last_render
+        )
+        if wait > 0:
+            self._method_preview_flush = self.set_timer(
+                wait, self._flush_method_preview
+            )
+            return
+        self._reload_method_preview()
+
+    def _flush_method_preview(self: "BAApp") -> None:
+        self._method_preview_flush = None
+        self._reload_method_preview()
+
+    def _reload_method_preview(self: "BAApp") -> None:
+        self._method_preview_last_render = time.monotonic()
+        # Separate group so a reload never cancels a pending path change
+        self.run_worker(
+            self._read_method_preview(
+                self._method_preview_path, self._method_preview_stat, reload=True
+            ),
+            exclusive=True,
+            group="method_preview_reload",
+        )
+
+    def _watch_method_preview(self: "BAApp") -> None:
+        """Follow the previewed file with OS notifications when available."""
+        self._method_preview_watched = self._method_preview_watcher.watch(
+            self._method_preview_path
+        )
+
+    def _on_method_file_changed(self: "BAApp") -> None:
+        # Runs on the watcher thread; a hidden preview catches up on tab switch
+        if not self._method_preview_visible:
             return
         try:
-            method_path = Path(self._method_preview_path)
-            if not method_path.exists():
-                return
-            mtime = method_path.stat().st_mtime
-            if self._method_preview_mtime is None or mtime > self._method_preview_mtime:
-                self._method_preview_mtime = mtime
-                text = method_path.read_text()
-                self.query_one("#method_preview", Markdown).update(text)
-        except Exception:
+            self.call_from_thread(self._poll_method_preview)
+        except RuntimeError:
             pass
 
+    def on_tabbed_content_tab_activated(
+        self: "BAApp", event: TabbedContent.TabActivated
+    ) -> None:
+        """Only poll the method file while its preview is on screen."""
+        try:
+            visible = (
+                self._main_tabs().active == "science"
+                and self.query_one("#science_sections", TabbedContent).active
+                == "science_method"
+            )
+        except NoMatches:
+            return
+        if visible and not self._method_preview_visible:
+            self._poll_method_preview()
+        self._method_preview_visible = visible
+
     def _maybe_sync_method_path(self: "BAApp") -> None:
         try:
-            current = self.query_one("#method_path", Input).value.strip()
+            current = self._method_path_widget().value.strip()
             if current and current != self._method_path:
                 self._method_path = current
-        except Exception:
+        except NoMatches:
             pass
 
     def _update_method_path_suggestions(
         self: "BAApp", input_id: str, current_value: str
     ) -> None:
         """Update method path suggestions dropdown."""
+        if not current_value:
+            self._hide_method_path_suggestions()
+            return
+        self.run_worker(
+            self._fill_method_path_suggestions(input_id, current_value),
+            exclusive=True,
+            group="method_path_suggestions",
+        )
+
+    async def _fill_method_path_suggestions(
+        self: "BAApp", input_id: str, current_value: str
+    ) -> None:
         try:
+            entries = await suggest_paths_async(current_value)
             suggestions = self._method_path_suggestions or self.query_one(
                 "#method_path_suggestions", OptionList
             )
             suggestions.clear_options()
-
-            if not current_value:
-                self._hide_method_path_suggestions()
-                return
-
-            path = Path(current_value).expanduser()
-            if path.is_dir():
-                search_dir = path
-                prefix = ""
-            else:
-                search_dir = path.parent
-                prefix = path.name.lower()
-
-            if not search_dir.exists():
-                self._hide_method_path_suggestions()
-                return
-
-            entries = []
-            for entry in sorted(search_dir.iterdir()):
-                name = entry.name
-                if prefix and not name.lower().startswith(prefix):
-                    continue
-                if entry.is_dir():
-                    entries.append((str(entry), f"📁 {name}/"))
-                else:
-                    entries.append((str(entry), f"📄 {name}"))
-                if len(entries) >= 20:
-                    break
-
             if entries:
-                for entry_path, display_name in entries:
-                    suggestions.add_option(Option(display_name, id=entry_path))
+                suggestions.add_options(
+                    [Option(name, id=entry_path) for entry_path, name in entries]
+                )
                 suggestions.add_class("visible")
                 self._method_path_suggestions_visible = True
                 self._active_method_input = input_id
@@ -160,6 +316,7 @@ class MethodPreviewMixin:
 
     def _hide_method_path_suggestions(self: "BAApp") -> None:
         """Hide the method path suggestions dropdown."""
+        self.workers.cancel_group(self, "method_path_suggestions")
         try:
             suggestions = self._method_path_suggestions or self.query_one(
                 "#method_path_suggestions", OptionList
@@ -168,5 +325,5 @@ class MethodPreviewMixin:
             suggestions.clear_options()
             self._active_method_input = None
             self._method_path_suggestions_visible = False
-        except Exception:
+        except NoMatches:
             pass
@@ -4,7 +4,8 @@ from datetime import date, datetime
 import pendulum
 from textual.widgets import DataTable, TabbedContent
 
-from ..screens import MilestoneModal
+from .. import screens
+from ..widgets import sync_table_rows
 
 
 class MilestonesMixin:
@@ -15,23 +16,24 @@ class MilestonesMixin:
     def _populate_milestones_table(self) -> None:
         try:
             table = self.query_one("#milestones_table", DataTable)
-            table.clear(columns=True)
-            table.add_columns("Name", "Target", "Actual", "Status", "Notes")
-            for idx, row in enumerate(self._milestone_rows):
-                table.add_row(
-                    str(row.get("name", "")),
-                    self._format_date_cell(row.get("target_date")),
-                    self._format_date_cell(row.get("actual_date")),
-                    str(row.get("status", "pending")),
-                    self._truncate_text(str(row.get("notes", ""))),
-                    key=str(idx),
-                )
+            sync_table_rows(
+                table,
+                [
+                    (
+                        str(row.get("name", "")),
+                        self._format_date_cell(row.get("target_date")),
+                        self._format_date_cell(row.get("actual_date")),
+                        str(row.get("status", "pending")),
+                        self._truncate_text(str(row.get("notes", ""))),
+                    )
+                    for row in self._milestone_rows
+                ],
+                ("Name", "Target", "Actual", "Status", "Notes"),
+            )
         except Exception:
             pass
 
     def _format_date_cell(self, value: object) -> str:
-        from datetime import datetime
-
         # Handle datetime objects (including pendulum.DateTime) - extract date only
         if isinstance(value, datetime):
             return date(value.year, value.month, value.day).isoformat()
@@ -118,7 +120,7 @@ class MilestonesMixin:
         return f"{value[: max_len - 3]}..."
 
     def action_add_milestone(self) -> None:
-        tabbed = self.query_one("#tabs", TabbedContent)
+        tabbed = self._main_tabs()
         if tabbed.active != "admin":
             return
         admin_sections = self.query_one("#admin_sections", TabbedContent)
@@ -133,7 +135,9 @@ class MilestonesMixin:
                 initial_data["name"] = ""
         except Exception:
             initial_data = None
-        self.push_screen(MilestoneModal(initial_data), self._handle_new_milestone)
+        self.push_screen(
+            screens.MilestoneModal(initial_data), self._handle_new_milestone
+        )
 
     def action_remove_milestone(self) -> None:
         try:
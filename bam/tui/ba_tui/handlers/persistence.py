@@ -1,6 +1,7 @@
 from __future__ import annotations
 # pyright: reportUnknownMemberType=false, reportUnknownVariableType=false, reportGeneralTypeIssues=false
 
+import os
 from datetime import datetime
 from pathlib import Path
 from typing import Any
@@ -14,10 +15,12 @@ from textual.widgets import (
     SelectionList,
     Select,
     Static,
+    TabbedContent,
     TextArea,
 )
 
-from ..io import dump_manifest
+from ..config import SafeDumper, SafeLoader
+from ..io import dump_manifest, write_manifest_bytes
 from ..models import (
     Manifest,
     Manifest as ManifestModel,
@@ -25,7 +28,8 @@ from ..models import (
     raise_validation_error,
 )
 from ..scaffold import ensure_data_symlink, ensure_directories, ensure_worklog
-from ..widgets import DateSelect
+from ..tabs.manifest import MANIFEST_SECTIONS
+from ..widgets import DateSelect, select_values
 
 
 def validate_manifest_data(
@@ -51,6 +55,14 @@ def validate_manifest_data(
         return (False, f"Validation error: {str(e)}", None)
 
 
+def _file_signature(path: Path) -> tuple[int, int] | None:
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
 def create_manifest_backup(manifest_path: Path) -> Path | None:
     """Create a timestamped backup of the manifest file.
 
@@ -74,6 +86,83 @@ def create_manifest_backup(manifest_path: Path) -> Path | None:
         return None
 
 
+# Form widgets read and written by the save/reload paths, looked up once per app
+_FORM_WIDGETS = (
+    ("project_name", Input),
+    ("project_status", Select),
+    ("analyst", Input),
+    ("project_tags", Input),
+    ("data_enabled", Checkbox),
+    ("fund_code", Input),
+    ("hourly_rate", Input),
+    ("budget_hours", Input),
+    ("spent_hours", Input),
+    ("billing_start_date", DateSelect),
+    ("billing_end_date", DateSelect),
+    ("billing_notes", TextArea),
+    ("acquisition_table", DataTable),
+    ("git_remote", Input),
+    ("environment", Select),
+    ("environment_custom", Input),
+    ("env_file", Input),
+    ("languages_list", SelectionList),
+    ("software_list", SelectionList),
+    ("cluster_packages_list", SelectionList),
+    ("method_path", Input),
+    ("pub_status", Select),
+    ("target_journal", Input),
+    ("manuscript_path", Input),
+    ("preprint_doi", Input),
+    ("published_doi", Input),
+    ("github_repo", Input),
+    ("zenodo_doi", Input),
+    ("pub_notes", TextArea),
+    ("archive_status", Select),
+    ("archive_date", DateSelect),
+    ("archive_endpoint", Select),
+    ("archive_endpoint_custom", Input),
+    ("archive_location", Input),
+    ("retention_years", Input),
+    ("backup_verified", Checkbox),
+    ("archive_notes", TextArea),
+)
+
+# Billing inputs saved by _save_init: (widget id and manifest key, converter)
+_BILLING_INPUTS = (
+    ("fund_code", str),
+    ("hourly_rate", float),
+    ("budget_hours", float),
+    ("spent_hours", float),
+)
+
+# Inputs returned by _collect_values, read as "" when not composed (the
+# current layout has no modality_custom input)
+_VALUE_INPUTS = ("project_name", "analyst", "modality_custom", "environment_custom")
+
+# SelectionList id -> Tools attribute it is saved to and restored from
+_TOOL_LISTS = (
+    ("languages_list", "languages"),
+    ("software_list", "software"),
+    ("cluster_packages_list", "cluster_packages"),
+)
+
+# (widget id, manifest section, field, widget attribute, skip when the manifest
+# value is empty) for fields copied into the form as plain strings
+_FORM_FIELDS = (
+    ("project_name", "project", "name", "value", False),
+    ("project_status", "project", "status", "value", True),
+    ("analyst", "people", "analyst", "value", False),
+    ("fund_code", "billing", "fund_code", "value", False),
+    ("hourly_rate", "billing", "hourly_rate", "value", False),
+    ("budget_hours", "billing", "budget_hours", "value", False),
+    ("spent_hours", "billing", "spent_hours", "value", False),
+    ("billing_notes", "billing", "notes", "text", False),
+    ("git_remote", "tools", "git_remote", "value", True),
+    ("environment", "tools", "environment", "value", True),
+    ("env_file", "tools", "env_file", "value", False),
+)
+
+
 class PersistenceMixin:
     """Mixin for saving/loading manifest and form state."""
 
@@ -109,7 +198,13 @@ class PersistenceMixin:
     _load_session_channels: Any
     _populate_channels_table: Any
     _load_method_preview: Any
-    _refresh_init_validation: Any
+    _schedule_validation: Any
+    _form_widget_cache: dict[str, Any] | None
+    _manifest_area_cache: dict[str, TextArea] | None
+    _manifest_section_text: dict[str, tuple[Any, str]]
+    # Section -> loaded value not yet written into its TextArea
+    _manifest_pending_sections: dict[str, Any]
+    _manifest_yaml_cache: tuple[tuple[int, int] | None, dict[str, Any], bytes] | None
     _collect_collaborators: Any
     _collect_datasets: Any
     _normalize_date: Any
@@ -125,27 +220,53 @@ class PersistenceMixin:
     _collect_archive: Any
     _collect_artifacts: Any
 
+    def _form_widgets(self) -> dict[str, Any]:
+        """Return the form widgets by id, querying the DOM only once."""
+        if self._form_widget_cache is not None:
+            return self._form_widget_cache
+        widgets: dict[str, Any] = {}
+        for widget_id, widget_type in _FORM_WIDGETS:
+            try:
+                widgets[widget_id] = self.query_one(f"#{widget_id}", widget_type)
+            except Exception:
+                pass
+        # Keep retrying until every tab has been composed
+        if len(widgets) == len(_FORM_WIDGETS):
+            self._form_widget_cache = widgets
+        return widgets
+
+    def _manifest_areas(self) -> dict[str, TextArea]:
+        """Return the manifest section TextAreas by section name."""
+        if self._manifest_area_cache is not None:
+            return self._manifest_area_cache
+        areas: dict[str, TextArea] = {}
+        for section in MANIFEST_SECTIONS:
+            try:
+                areas[section] = self.query_one(f"#manifest_{section}_area", TextArea)
+            except Exception:
+                pass
+        # The manifest tab is composed whole or not at all, so once mounted
+        # the result is final; caching the empty case spares the app without
+        # a manifest tab twelve failing queries per call
+        if self.is_mounted:
+            self._manifest_area_cache = areas
+        return areas
+
     def _reload_form_from_manifest(self, manifest: ManifestModel) -> None:
         """Reload all form fields from manifest data."""
-        # Project fields
-        try:
-            self.query_one("#project_name", Input).value = manifest.project.name
-        except Exception:
-            pass
-        try:
-            if manifest.project.status:
-                self.query_one(
-                    "#project_status", Select
-                ).value = manifest.project.status
-        except Exception:
-            pass
-
-        # People fields
-        try:
-            if manifest.people:
-                self.query_one("#analyst", Input).value = manifest.people.analyst or ""
-        except Exception:
-            pass
+        widgets = self._form_widgets()
+        # Plain scalar fields
+        for widget_id, section_name, field_name, attr, skip_empty in _FORM_FIELDS:
+            section = getattr(manifest, section_name, None)
+            if section is None:
+                continue
+            value = getattr(section, field_name, None)
+            if skip_empty and not value:
+                continue
+            try:
+                setattr(widgets[widget_id], attr, "" if value is None else str(value))
+            except Exception:
+                pass
 
         # Collaborators
         try:
@@ -168,16 +289,16 @@ class PersistenceMixin:
         # Tags
         try:
             if manifest.tags:
-                self.query_one("#project_tags", Input).value = ", ".join(manifest.tags)
+                widgets["project_tags"].value = ", ".join(manifest.tags)
             else:
-                self.query_one("#project_tags", Input).value = ""
+                widgets["project_tags"].value = ""
         except Exception:
             pass
 
         # Data fields
         try:
             has_datasets = bool(manifest.datasets)
-            self.query_one("#data_enabled", Checkbox).value = has_datasets
+            widgets["data_enabled"].value = has_datasets
             self._toggle_data_sections(has_datasets)
             self._dataset_rows = [
                 {
@@ -237,29 +358,10 @@ class PersistenceMixin:
         # Billing fields
         try:
             if manifest.billing:
-                self.query_one("#fund_code", Input).value = manifest.billing.fund_code
-                self.query_one("#hourly_rate", Input).value = (
-                    ""
-                    if manifest.billing.hourly_rate is None
-                    else str(manifest.billing.hourly_rate)
-                )
-                self.query_one("#budget_hours", Input).value = (
-                    ""
-                    if manifest.billing.budget_hours is None
-                    else str(manifest.billing.budget_hours)
-                )
-                self.query_one("#spent_hours", Input).value = (
-                    ""
-                    if manifest.billing.spent_hours is None
-                    else str(manifest.billing.spent_hours)
-                )
-                start_picker = self.query_one("#billing_start_date", DateSelect)
-                end_picker = self.query_one("#billing_end_date", DateSelect)
+                start_picker = widgets["billing_start_date"]
+                end_picker = widgets["billing_end_date"]
                 start_picker.date = self._to_pendulum_date(manifest.billing.start_date)
                 end_picker.date = self._to_pendulum_date(manifest.billing.end_date)
-                self.query_one("#billing_notes", TextArea).text = (
-                    manifest.billing.notes or ""
-                )
         except Exception:
             pass
 
@@ -353,7 +455,7 @@ class PersistenceMixin:
                 self._populate_acquisition_table()
                 if self._acquisition_rows:
                     try:
-                        table = self.query_one("#acquisition_table", DataTable)
+                        table = widgets["acquisition_table"]
                         table.show_cursor = True
                         table.move_cursor(row=0, column=0)
                         self._load_session_channels(0)
@@ -366,69 +468,21 @@ class PersistenceMixin:
             pass
 
         # Tools fields
-        try:
-            if manifest.tools:
-                if manifest.tools.git_remote:
-                    self.query_one(
-                        "#git_remote", Input
-                    ).value = manifest.tools.git_remote
-                if manifest.tools.environment:
-                    self.query_one(
-                        "#environment", Select
-                    ).value = manifest.tools.environment
-                self.query_one("#env_file", Input).value = manifest.tools.env_file or ""
-                if manifest.tools.languages:
-                    try:
-                        languages_list = self.query_one(
-                            "#languages_list", SelectionList
-                        )
-                        languages_list.deselect_all()
-                        for item in languages_list._options:
-                            if item.id in manifest.tools.languages:
-                                languages_list.select(item.id)
-                    except Exception:
-                        pass
-                if manifest.tools.software:
-                    try:
-                        software_list = self.query_one("#software_list", SelectionList)
-                        software_list.deselect_all()
-                        for item in software_list._options:
-                            if item.id in manifest.tools.software:
-                                software_list.select(item.id)
-                    except Exception:
-                        pass
-                if manifest.tools.languages:
-                    try:
-                        languages_list = self.query_one(
-                            "#languages_list", SelectionList
-                        )
-                        languages_list.deselect_all()
-                        for item in languages_list._options:
-                            if item.id in manifest.tools.languages:
-                                languages_list.select(item.id)
-                    except Exception:
-                        pass
-                if manifest.tools.cluster_packages:
-                    try:
-                        cluster_list = self.query_one(
-                            "#cluster_packages_list", SelectionList
-                        )
-                        cluster_list.deselect_all()
-                        for item in cluster_list._options:
-                            if item.id in manifest.tools.cluster_packages:
-                                cluster_list.select(item.id)
-                    except Exception:
-                        pass
-        except Exception:
-            pass
+        if manifest.tools:
+            for list_id, attr in _TOOL_LISTS:
+                values = getattr(manifest.tools, attr)
+                if not values:
+                    continue
+                try:
+                    select_values(widgets[list_id], values, replace=True)
+                except Exception:
+                    pass
 
         # Method fields
         try:
             if manifest.method:
                 if manifest.method.file_path:
-                    self.query_one(
-                        "#method_path", Input
-                    ).value = manifest.method.file_path
+                    widgets["method_path"].value = manifest.method.file_path
                     self._load_method_preview()
                 if manifest.method.template_used:
                     self._method_template_used = manifest.method.template_used
@@ -476,7 +530,7 @@ class PersistenceMixin:
             pass
 
         # Refresh validation states
-        self._refresh_init_validation()
+        self._schedule_validation()
 
     def _save_init(self) -> None:
         """Save form data from all tabs to manifest without exiting."""
@@ -496,14 +550,20 @@ class PersistenceMixin:
             )
             return
 
+        widgets = self._form_widgets()
         try:
             # Load existing manifest or create new one
             manifest_path = self._project_root / "manifest.yaml"
-            if manifest_path.exists():
-                with open(manifest_path) as f:
-                    manifest_data = yaml.safe_load(f) or {}
+            cached, self._manifest_yaml_cache = self._manifest_yaml_cache, None
+            if cached is not None and cached[0] == _file_signature(manifest_path):
+                # Nothing has touched the file since our last save
+                _, manifest_data, saved_yaml = cached
             else:
-                manifest_data = {}
+                try:
+                    saved_yaml = manifest_path.read_bytes()
+                except FileNotFoundError:
+                    saved_yaml = b""
+                manifest_data = yaml.load(saved_yaml, Loader=SafeLoader) or {}
 
             # Update project section
             if "project" not in manifest_data:
@@ -512,14 +572,14 @@ class PersistenceMixin:
 
             # Collect additional project fields
             try:
-                status_select = self.query_one("#project_status", Select)
+                status_select = widgets["project_status"]
                 if status_select.value and status_select.value != Select.BLANK:
                     manifest_data["project"]["status"] = str(status_select.value)
             except Exception:
                 pass
 
             try:
-                tags_input = self.query_one("#project_tags", Input).value.strip()
+                tags_input = widgets["project_tags"].value.strip()
                 if tags_input:
                     manifest_data["tags"] = [
                         tag.strip() for tag in tags_input.split(",") if tag.strip()
@@ -550,34 +610,19 @@ class PersistenceMixin:
             # Collect billing data
             try:
                 billing_data = {}
-                fund_code = self.query_one("#fund_code", Input).value.strip()
-                if fund_code:
-                    billing_data["fund_code"] = fund_code
-
-                hourly_rate = self.query_one("#hourly_rate", Input).value.strip()
-                if hourly_rate:
-                    billing_data["hourly_rate"] = float(hourly_rate)
-
-                budget_hours = self.query_one("#budget_hours", Input).value.strip()
-                if budget_hours:
-                    billing_data["budget_hours"] = float(budget_hours)
-
-                spent_hours = self.query_one("#spent_hours", Input).value.strip()
-                if spent_hours:
-                    billing_data["spent_hours"] = float(spent_hours)
+                for key, convert in _BILLING_INPUTS:
+                    text = widgets[key].value.strip()
+                    if text:
+                        billing_data[key] = convert(text)
 
-                start_date = self._normalize_date(
-                    self.query_one("#billing_start_date", DateSelect).value
-                )
-                end_date = self._normalize_date(
-                    self.query_one("#billing_end_date", DateSelect).value
-                )
+                start_date = self._normalize_date(widgets["billing_start_date"].value)
+                end_date = self._normalize_date(widgets["billing_end_date"].value)
                 if start_date:
                     billing_data["start_date"] = start_date
                 if end_date:
                     billing_data["end_date"] = end_date
 
-                notes = self.query_one("#billing_notes", TextArea).text.strip()
+                notes = widgets["billing_notes"].text.strip()
                 if notes:
                     billing_data["notes"] = notes
 
@@ -619,7 +664,7 @@ class PersistenceMixin:
                 if self._acquisition_rows:
                     idx = 0
                     try:
-                        table = self.query_one("#acquisition_table", DataTable)
+                        table = widgets["acquisition_table"]
                         if table.cursor_row is not None:
                             idx = table.cursor_row
                     except Exception:
@@ -643,52 +688,35 @@ class PersistenceMixin:
             try:
                 tools_data = {}
 
-                git_remote = self.query_one("#git_remote", Input).value.strip()
+                git_remote = widgets["git_remote"].value.strip()
                 if git_remote:
                     tools_data["git_remote"] = git_remote
 
-                env_select = self.query_one("#environment", Select)
+                env_select = widgets["environment"]
                 environment_value = (
                     str(env_select.value)
                     if env_select.value and env_select.value != Select.BLANK
                     else ""
                 )
                 if environment_value.lower() == "other":
-                    custom = self.query_one("#environment_custom", Input).value.strip()
+                    custom = widgets["environment_custom"].value.strip()
                     if custom:
                         environment_value = custom
                 if environment_value:
                     tools_data["environment"] = environment_value
 
-                env_file = self.query_one("#env_file", Input).value.strip()
+                env_file = widgets["env_file"].value.strip()
                 if env_file:
                     tools_data["env_file"] = env_file
 
-                try:
-                    languages_list = self.query_one("#languages_list", SelectionList)
-                    languages = [str(item) for item in languages_list.selected]
-                    if languages:
-                        tools_data["languages"] = languages
-                except Exception:
-                    pass
-
-                try:
-                    software_list = self.query_one("#software_list", SelectionList)
-                    software = [str(item) for item in software_list.selected]
-                    if software:
-                        tools_data["software"] = software
-                except Exception:
-                    pass
-
-                try:
-                    cluster_list = self.query_one(
-                        "#cluster_packages_list", SelectionList
-                    )
-                    cluster_packages = [str(item) for item in cluster_list.selected]
-                    if cluster_packages:
-                        tools_data["cluster_packages"] = cluster_packages
-                except Exception:
-                    pass
+                # Option values are already strings and selected is a new list
+                for list_id, attr in _TOOL_LISTS:
+                    try:
+                        selected = widgets[list_id].selected
+                    except Exception:
+                        continue
+                    if selected:
+                        tools_data[attr] = selected
 
                 # Only update tools section if we have data to add
                 if tools_data:
@@ -700,7 +728,7 @@ class PersistenceMixin:
 
             # Collect method data
             try:
-                method_path = self.query_one("#method_path", Input).value.strip()
+                method_path = widgets["method_path"].value.strip()
                 if method_path:
                     manifest_data["method"] = {
                         "file_path": method_path,
@@ -770,18 +798,31 @@ class PersistenceMixin:
             ensure_directories(self._project_root)
             ensure_worklog(self._project_root)
 
-            with open(manifest_path, "w") as f:
-                yaml.safe_dump(manifest_data, f, sort_keys=False)
+            manifest_yaml = yaml.dump(
+                manifest_data, Dumper=SafeDumper, sort_keys=False, encoding="utf-8"
+            )
+            # Skip the write (and the mtime bump) when the file already matches
+            changed = manifest_yaml != saved_yaml
+            if changed:
+                write_manifest_bytes(manifest_path, manifest_yaml)
+            self._manifest_yaml_cache = (
+                _file_signature(manifest_path),
+                manifest_data,
+                manifest_yaml,
+            )
 
             if manifest_data.get("datasets"):
                 local_path = manifest_data["datasets"][0].get("local")
                 if local_path:
                     ensure_data_symlink(self._project_root, Path(local_path))
 
-            # Reload the manifest to update the internal state
-            self._manifest = Manifest.model_validate(manifest_data)
+            # manifest_data is unchanged since it was validated above
+            self._manifest = validated_manifest
 
-            self.notify("Manifest saved", severity="information")
+            self.notify(
+                "Manifest saved" if changed else "No changes to save",
+                severity="information",
+            )
         except Exception as e:
             self.notify(f"Save failed: {e}", severity="error", markup=False)
 
@@ -791,35 +832,43 @@ class PersistenceMixin:
         # Ctrl+S should save the manifest, not the tasks
         self._save_init()
 
-    def _save_manifest(self) -> None:
-        """Save manifest tab without exiting."""
-        # Reuse the validation logic from _submit_manifest but don't exit
-        sections = {}
-        errors = {}
-        for section in (
-            "project",
-            "people",
-            "tags",
-            "data",
-            "acquisition",
-            "tools",
-            "billing",
-            "publication",
-            "archive",
-            "timeline",
-            "artifacts",
-            "hub",
-        ):
-            area = self.query_one(f"#manifest_{section}_area", TextArea)
+    def _parse_manifest_sections(self) -> tuple[dict[str, Any], dict[str, str]]:
+        """Parse every manifest section TextArea and mark it valid or invalid.
+
+        Returns the parsed sections (None for empty areas) and the YAML
+        error message for each section that failed to parse. Sections not
+        shown yet, or still holding the text _load_manifest_sections wrote,
+        reuse the loaded value.
+        """
+        sections: dict[str, Any] = {}
+        errors: dict[str, str] = {}
+        loaded = self._manifest_section_text
+        pending = self._manifest_pending_sections
+        for section, area in self._manifest_areas().items():
+            if section in pending:
+                sections[section] = pending[section]
+                continue
             raw_text = area.text.strip()
+            previous = loaded.get(section)
             try:
-                sections[section] = yaml.safe_load(raw_text) if raw_text else None
+                if previous is not None and raw_text == previous[1]:
+                    sections[section] = previous[0]
+                else:
+                    sections[section] = (
+                        yaml.load(raw_text, Loader=SafeLoader) if raw_text else None
+                    )
                 area.remove_class("invalid")
                 area.add_class("valid")
             except yaml.YAMLError as exc:
                 errors[section] = str(exc)
                 area.remove_class("valid")
                 area.add_class("invalid")
+        return sections, errors
+
+    def _save_manifest(self) -> None:
+        """Save manifest tab without exiting."""
+        # Reuse the validation logic from _submit_manifest but don't exit
+        sections, errors = self._parse_manifest_sections()
 
         if errors:
             self.notify("Fix YAML errors before saving", severity="error")
@@ -828,8 +877,12 @@ class PersistenceMixin:
         try:
             manifest_data = {k: v for k, v in sections.items() if v is not None}
 
-            # Validate before saving
-            is_valid, error_msg, manifest = validate_manifest_data(manifest_data)
+            # Validate before saving; an untouched manifest is already valid
+            manifest = self._unchanged_manifest(manifest_data)
+            if manifest is not None:
+                is_valid, error_msg = True, ""
+            else:
+                is_valid, error_msg, manifest = validate_manifest_data(manifest_data)
             manifest_path = self._project_root / "manifest.yaml"
 
             if not is_valid:
@@ -855,84 +908,93 @@ class PersistenceMixin:
         except Exception as e:
             self.notify(f"Save failed: {e}", severity="error", markup=False)
 
+    def _unchanged_manifest(self, manifest_data: dict[str, Any]) -> Manifest | None:
+        """Return the loaded manifest if the sections still match it exactly."""
+        source = self._manifest_sections_source
+        if source is not None and manifest_data == source[1]:
+            return source[0]
+        return None
+
     def _collect_values(self) -> dict[str, object]:
-        data_enabled = self.query_one("#data_enabled", Checkbox)
-        modality_custom = ""
-        environment_custom = ""
-        try:
-            modality_custom = self.query_one("#modality_custom", Input).value
-        except Exception:
-            pass
-        try:
-            environment_custom = self.query_one("#environment_custom", Input).value
-        except Exception:
-            pass
-        return {
-            "project_name": self.query_one("#project_name", Input).value,
-            "analyst": self.query_one("#analyst", Input).value,
-            "data_enabled": data_enabled.value,
-            "datasets": self._dataset_rows,
-            "modality_custom": modality_custom,
-            "environment_custom": environment_custom,
+        widgets = self._form_widgets()
+        values: dict[str, object] = {
+            key: widgets[key].value if key in widgets else ""
+            for key in _VALUE_INPUTS
         }
+        values["data_enabled"] = widgets["data_enabled"].value
+        values["datasets"] = self._dataset_rows
+        return values
 
     def _load_manifest_sections(self) -> None:
+        """Queue every manifest section for display and show the open one.
+
+        The other sections are dumped to YAML when their tab is first opened.
+        """
         if self._manifest is None:
             return
+        areas = self._manifest_areas()
+        if not areas:
+            return
         manifest_dict = self._manifest.model_dump(mode="json", exclude_none=True)
-        for section, value in manifest_dict.items():
-            area_id = f"#manifest_{section}_area"
-            try:
-                area = self.query_one(area_id, TextArea)
-            except Exception:
-                continue
+        self._manifest_pending_sections = {
+            section: value
+            for section, value in manifest_dict.items()
+            if section in areas
+        }
+        # Submitting unedited sections can hand back the loaded manifest only
+        # if it holds nothing outside the section areas
+        self._manifest_sections_source = (
+            (self._manifest, dict(self._manifest_pending_sections))
+            if not any(
+                value for key, value in manifest_dict.items() if key not in areas
+            )
+            else None
+        )
+        try:
+            active = self.query_one("#manifest_sections", TabbedContent).active
+        except Exception:
+            return
+        self._show_manifest_section(active.removeprefix("manifest_"))
+
+    def _show_manifest_section(self, section: str) -> None:
+        """Write a pending section into its TextArea."""
+        if section not in self._manifest_pending_sections:
+            return
+        value = self._manifest_pending_sections.pop(section)
+        area = self._manifest_areas()[section]
+        # Skip the dump and the TextArea rewrite when neither the section
+        # nor the text on screen changed since the last load
+        previous = self._manifest_section_text.get(section)
+        if previous is None or previous[0] != value or area.text != previous[1]:
             text = (
-                yaml.safe_dump(value, sort_keys=False).strip()
+                yaml.dump(value, Dumper=SafeDumper, sort_keys=False).strip()
                 if value is not None
                 else ""
             )
             area.text = text
-            area.remove_class("invalid")
-            area.remove_class("valid")
-            area.add_class("valid")
+            self._manifest_section_text[section] = (value, text)
+        area.remove_class("invalid")
+        area.set_class(True, "valid")
+
+    def on_tabbed_content_tab_activated(
+        self, event: TabbedContent.TabActivated
+    ) -> None:
+        if event.tabbed_content.id == "manifest_sections" and event.pane is not None:
+            self._show_manifest_section(str(event.pane.id).removeprefix("manifest_"))
 
     def _submit_manifest(self) -> None:
-        sections = {}
-        errors = {}
-        for section in (
-            "project",
-            "people",
-            "tags",
-            "data",
-            "acquisition",
-            "tools",
-            "billing",
-            "publication",
-            "archive",
-            "timeline",
-            "artifacts",
-            "hub",
-        ):
-            area = self.query_one(f"#manifest_{section}_area", TextArea)
-            raw_text = area.text.strip()
-            try:
-                sections[section] = yaml.safe_load(raw_text) if raw_text else None
-                area.remove_class("invalid")
-                area.add_class("valid")
-            except yaml.YAMLError as exc:
-                errors[section] = str(exc)
-                area.remove_class("valid")
-                area.add_class("invalid")
+        sections, errors = self._parse_manifest_sections()
 
         if errors:
             if self._manifest_errors is not None:
                 self._manifest_errors.update("Fix YAML errors before saving.")
             return
 
+        manifest_data = {k: v for k, v in sections.items() if v is not None}
         try:
-            manifest = Manifest.model_validate(
-                {k: v for k, v in sections.items() if v is not None}
-            )
+            manifest = self._unchanged_manifest(
+                manifest_data
+            ) or Manifest.model_validate(manifest_data)
         except Exception as exc:
             if self._manifest_errors is not None:
                 self._manifest_errors.update(f"Validation error: {exc}")
@@ -1,10 +1,42 @@
 from __future__ import annotations
 
 import asyncio
+import re
 import shutil
 from pathlib import Path
 from textual.widgets import ProgressBar, Static
 
+# Percentage field of rsync --info=progress2: "1,234,567  45%  1.23MB/s  0:01:23"
+_PROGRESS_RE = re.compile(rb"(\d{1,3})%")
+_PCT_LABELS = tuple(f"{pct}%" for pct in range(101))
+# Both ends of a sync are local paths (the source must be mounted); the
+# rolling-checksum delta pass only pays off over a network link
+_RSYNC_ARGS = (
+    "-a",
+    "--whole-file",
+    "--info=progress2",
+    "--no-inc-recursive",
+    "--outbuf=L",
+)
+# rsync output is read in blocks rather than one wakeup per progress update
+_READ_CHUNK = 4096
+
+
+def _check_sync_paths(source: str, local: str) -> tuple[str, str] | None:
+    """Return a (message, severity) notice when syncing is unnecessary or impossible."""
+    source_path = Path(source).expanduser().resolve()
+    local_path = Path(local).expanduser()
+
+    # Check if local cache is the source itself or a symlink pointing to it
+    if local_path.resolve() == source_path:
+        if local_path.is_symlink():
+            return "Local cache is linked to source, sync not needed", "information"
+        return "Local cache is same as source, sync not needed", "information"
+
+    if not source_path.exists():
+        return f"Source path does not exist: {source}", "error"
+    return None
+
 
 class SyncMixin:
     """Mixin for dataset sync operations."""
@@ -30,35 +62,21 @@ class SyncMixin:
             self.notify("Local path is empty", severity="error")
             return
 
-        source_path = Path(source).expanduser().resolve()
-        local_path = Path(local).expanduser().resolve()
-
-        # Check if source and local are the same
-        if source_path == local_path:
-            self.notify(
-                "Local cache is same as source, sync not needed", severity="information"
-            )
-            return
+        # Resolving paths can stall on network mounts; check them in a thread
+        self._syncing = True
+        self.run_worker(self._sync_dataset(source, local), exclusive=True)
 
-        # Check if local cache is a symlink pointing to source
-        if local_path.exists() and local_path.is_symlink():
-            try:
-                link_target = local_path.resolve()
-                if link_target == source_path:
-                    self.notify(
-                        "Local cache is linked to source, sync not needed",
-                        severity="information",
-                    )
-                    return
-            except Exception:
-                pass
-
-        if not source_path.exists():
-            self.notify(f"Source path does not exist: {source}", severity="error")
+    async def _sync_dataset(self, source: str, local: str) -> None:
+        try:
+            problem = await asyncio.to_thread(_check_sync_paths, source, local)
+        except Exception as e:
+            problem = (f"Sync error: {e}", "error")
+        if problem is not None:
+            self._syncing = False
+            message, severity = problem
+            self.notify(message, severity=severity, markup=False)
             return
-
-        self._syncing = True
-        self.run_worker(self._run_rsync(source, local), exclusive=True)
+        await self._run_rsync(source, local)
 
     async def _run_rsync(self, source: str, local: str) -> None:
         progress_bar = self.query_one("#sync_progress", ProgressBar)
@@ -66,7 +84,7 @@ class SyncMixin:
         progress_bar.add_class("visible")
         sync_pct.add_class("visible")
         progress_bar.update(progress=0)
-        sync_pct.update("0%")
+        sync_pct.update(_PCT_LABELS[0])
 
         try:
             # Check if rsync is available
@@ -78,54 +96,47 @@ class SyncMixin:
             source_path = source.rstrip("/") + "/"
             proc = await asyncio.create_subprocess_exec(
                 "rsync",
-                "-a",
-                "--info=progress2",
-                "--no-inc-recursive",
+                *_RSYNC_ARGS,
                 source_path,
                 local,
                 stdout=asyncio.subprocess.PIPE,
                 stderr=asyncio.subprocess.PIPE,
             )
 
-            while True:
-                if proc.stdout:
-                    line = await proc.stdout.readline()
-                else:
-                    break
-
-                if not line:
-                    break
+            # Drain stderr alongside stdout so a chatty rsync cannot block on it
+            stderr_task = asyncio.ensure_future(
+                proc.stderr.read() if proc.stderr else asyncio.sleep(0, b"")
+            )
 
-                # Check for None just to be safe for type checker, though readline checks above
-                if line is None:
+            last_pct = 0
+            pending = b""
+            while proc.stdout:
+                chunk = await proc.stdout.read(_READ_CHUNK)
+                if not chunk:
                     break
-
-                text = line.decode().strip()
-                # Parse rsync progress output: "1,234,567  45%  1.23MB/s  0:01:23"
-                if "%" in text:
-                    try:
-                        parts = text.split()
-                        for part in parts:
-                            if part.endswith("%"):
-                                pct = int(part.rstrip("%"))
-                                progress_bar.update(progress=pct)
-                                sync_pct.update(f"{pct}%")
-                                break
-                    except (ValueError, IndexError):
-                        pass
+                # progress2 redraws one status line with \r; only complete
+                # updates are parsed and the newest one in the chunk wins
+                data = pending + chunk
+                end = max(data.rfind(b"\r"), data.rfind(b"\n")) + 1
+                pending = data[end:]
+                matches = _PROGRESS_RE.findall(data, 0, end)
+                if matches:
+                    pct = min(int(matches[-1]), 100)
+                    if pct != last_pct:
+                        last_pct = pct
+                        progress_bar.update(progress=pct)
+                        sync_pct.update(_PCT_LABELS[pct])
 
             await proc.wait()
+            stderr = await stderr_task
 
             if proc.returncode == 0:
                 progress_bar.update(progress=100)
-                sync_pct.update("100%")
+                sync_pct.update(_PCT_LABELS[100])
                 self.notify("Sync completed successfully", severity="information")
             else:
-                stderr = b""
-                if proc.stderr:
-                    stderr = await proc.stderr.read()
                 self.notify(
-                    f"Sync failed: {stderr.decode().strip()}",
+                    f"Sync failed: {stderr.decode(errors='replace').strip()}",
                     severity="error",
                     markup=False,
                 )
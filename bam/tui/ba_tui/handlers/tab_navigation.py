@@ -7,6 +7,19 @@ from textual.widgets import TabbedContent
 if TYPE_CHECKING:
     from ..tui import BAApp
 
+# Main tabs in display order, and the reverse lookup used when cycling
+_TAB_ORDER = ("setup", "science", "admin", "outputs", "hub", "log", "idea")
+_TAB_INDEX = {tab: idx for idx, tab in enumerate(_TAB_ORDER)}
+
+# Main tab -> selector of its nested sections container
+_SUB_TABS = {
+    "setup": "#setup_sections",
+    "science": "#science_sections",
+    "admin": "#admin_sections",
+    "outputs": "#outputs_sections",
+    "hub": "#hub_sections",
+}
+
 
 class TabNavigationMixin:
     """Mixin for tab navigation actions."""
@@ -38,15 +51,26 @@ class TabNavigationMixin:
     def action_prev_tab(self: "BAApp") -> None:
         self._cycle_tab(-1)
 
+    def _main_tabs(self: "BAApp") -> TabbedContent:
+        """Return the top-level ``#tabs`` container, cached from on_mount."""
+        return self._tabs or self.query_one("#tabs", TabbedContent)
+
     def _set_tab(self: "BAApp", tab_id: str) -> None:
-        tabbed = self.query_one("#tabs", TabbedContent)
-        tabbed.active = tab_id
+        self._main_tabs().active = tab_id
 
     def _cycle_tab(self: "BAApp", delta: int) -> None:
-        tabbed = self.query_one("#tabs", TabbedContent)
-        tabs = ["setup", "science", "admin", "outputs", "hub", "log", "idea"]
+        tabbed = self._main_tabs()
+        current = _TAB_INDEX.get(tabbed.active, 0)
+        tabbed.active = _TAB_ORDER[(current + delta) % len(_TAB_ORDER)]
+
+    def _cycle_sub_tab(self: "BAApp", delta: int) -> None:
+        selector = _SUB_TABS.get(self._main_tabs().active)
+        if selector is None:
+            return
+        sub_tabbed = self.query_one(selector, TabbedContent)
+        tabs = [str(tab.id) for tab in sub_tabbed.query("TabPane")]
         try:
-            current = tabs.index(tabbed.active)
+            current = tabs.index(sub_tabbed.active)
         except ValueError:
             current = 0
-        tabbed.active = tabs[(current + delta) % len(tabs)]
+        sub_tabbed.active = tabs[(current + delta) % len(tabs)]
@@ -1,11 +1,17 @@
 from __future__ import annotations
 
+import asyncio
+import json
+import threading
 from pathlib import Path
-from typing import TYPE_CHECKING
+from types import MappingProxyType
+from typing import TYPE_CHECKING, Mapping
 
-import yaml
+from textual.css.query import NoMatches
 from textual.widgets import TabbedContent, Tree
 
+from ..config import load_yaml_cached
+
 if TYPE_CHECKING:
     from ..tui import BAApp
 
@@ -17,12 +23,19 @@ SUB_TAB_IDS = {
     "manifest": "#manifest_sections",
 }
 
+_NO_STATE: Mapping[str, object] = MappingProxyType({})
+
+# Serializes writes of the shared state file across writer threads
+_UI_STATE_LOCK = threading.Lock()
+
 
 class UIStateMixin:
     """Mixin for persisting UI state."""
 
     _project_root: Path
     _ui_state_path: Path
+    _ui_state_written: dict[str, object] | None
+    _project_state_key: str | None
     _figure_expanded_ids: set[str]
     _figure_selected_id: str | None
     _last_working_task_id: str | None
@@ -32,15 +45,35 @@ class UIStateMixin:
 
     def _get_project_state_key(self: "BAApp") -> str:
         """Return a unique key for this project's UI state."""
-        return str(self._project_root.resolve())
+        # The project root is fixed for the app's lifetime; resolve it once
+        if self._project_state_key is None:
+            self._project_state_key = str(self._project_root.resolve())
+        return self._project_state_key
 
-    def _apply_ui_state(self: "BAApp") -> None:
+    def _read_ui_state(self: "BAApp") -> Mapping[str, object]:
+        """Load the stored UI state for all projects as a read-only view.
+
+        The view wraps the cached parse result, so an unchanged file costs one
+        stat and no copy; callers that modify it must take a dict() copy.
+        Falls back to the legacy ui_state.yaml next to the JSON file so state
+        saved by older versions is picked up; the next store migrates it.
+        """
         try:
-            if not self._ui_state_path.exists():
-                return
-            with open(self._ui_state_path) as f:
-                all_state = yaml.safe_load(f) or {}
+            path = self._ui_state_path
+            if not path.exists():
+                path = path.with_suffix(".yaml")
+                if not path.exists():
+                    return _NO_STATE
+            all_state = load_yaml_cached(path)
         except Exception:
+            return _NO_STATE
+        if not isinstance(all_state, dict):
+            return _NO_STATE
+        return MappingProxyType(all_state)
+
+    def _apply_ui_state(self: "BAApp") -> None:
+        all_state = self._read_ui_state()
+        if not all_state:
             return
 
         # Get project-specific state
@@ -77,7 +110,7 @@ class UIStateMixin:
 
         if tab_id:
             try:
-                tabbed = self.query_one("#tabs", TabbedContent)
+                tabbed = self._main_tabs()
                 tabbed.active = str(tab_id)
             except Exception:
                 pass
@@ -101,8 +134,15 @@ class UIStateMixin:
                 except Exception:
                     pass
 
-            # Use set_timer with small delay to ensure tab content is ready
-            self.set_timer(0.1, _focus_later)
+            try:
+                widget = self.query_one(f"#{focus_id}")
+                # Already composed; focus once the restored tabs have refreshed
+                self.call_after_refresh(widget.focus)
+            except NoMatches:
+                # Content not mounted yet; give the tab a moment to compose
+                self.set_timer(0.1, _focus_later)
+            except Exception:
+                pass
 
     def _store_ui_state(self: "BAApp") -> None:
         try:
@@ -111,7 +151,7 @@ class UIStateMixin:
         except Exception:
             return
         try:
-            tabbed = self.query_one("#tabs", TabbedContent)
+            tabbed = self._main_tabs()
             active_tab = tabbed.active
         except Exception:
             active_tab = ""
@@ -205,16 +245,42 @@ class UIStateMixin:
         if task_selected_session_index is not None:
             project_state["task_selected_session_index"] = task_selected_session_index
 
+        # Nothing to write if this project's state is what we last stored
+        if project_state == self._ui_state_written:
+            return
+
+        self._ui_state_written = project_state
+        # Merge here rather than in the writer so the parse cache is only
+        # touched from the UI thread; unless the file changed this is a stat
+        all_state = dict(self._read_ui_state())
+        all_state[project_key] = project_state
         try:
-            self._ui_state_path.parent.mkdir(parents=True, exist_ok=True)
-            # Load existing state for all projects
-            all_state = {}
-            if self._ui_state_path.exists():
-                with open(self._ui_state_path) as f:
-                    all_state = yaml.safe_load(f) or {}
-            # Update state for this project
-            all_state[project_key] = project_state
-            with open(self._ui_state_path, "w") as f:
-                yaml.safe_dump(all_state, f, sort_keys=False)
-        except Exception:
-            pass
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self._write_ui_state(all_state, project_state)
+            return
+        # Executor jobs are joined at interpreter exit, so a store made just
+        # before self.exit() still reaches the disk without blocking the UI
+        loop.run_in_executor(None, self._write_ui_state, all_state, project_state)
+
+    def _write_ui_state(
+        self: "BAApp",
+        all_state: dict[str, object],
+        project_state: dict[str, object],
+    ) -> None:
+        """Write the merged state file (runs off the UI thread)."""
+        with _UI_STATE_LOCK:
+            # A newer store superseded this one while it waited for the lock
+            if project_state is not self._ui_state_written:
+                return
+            try:
+                self._ui_state_path.parent.mkdir(parents=True, exist_ok=True)
+                # Write to a temp file and rename so a crash never leaves a
+                # torn file
+                tmp_path = self._ui_state_path.with_suffix(".json.tmp")
+                tmp_path.write_text(json.dumps(all_state, separators=(",", ":")))
+                tmp_path.replace(self._ui_state_path)
+            except Exception:
+                # Let the next store retry unless a newer one is queued
+                if self._ui_state_written is project_state:
+                    self._ui_state_written = None
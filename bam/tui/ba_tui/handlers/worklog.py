@@ -2,14 +2,14 @@
 
 from __future__ import annotations
 
-from datetime import timedelta
-import time
+from datetime import datetime
 from pathlib import Path
 
-import yaml
+from textual.containers import Horizontal, Vertical
 from textual.widgets import Button, Static, Tree
 from textual.widgets.tree import TreeNode
 
+from .. import screens
 from ..models import (
     LogTaskStatus,
     RunStatus,
@@ -19,9 +19,7 @@ from ..models import (
     TaskSubCategory,
     WorkLog,
 )
-from ..screens.edit_session_modal import EditSessionModal
-from ..screens.session_note_modal import SessionNoteModal
-from ..screens.task_modal import TaskModal
+from ..tabs.log import format_duration
 from ..worklog import (
     add_session_note,
     complete_task,
@@ -38,19 +36,6 @@ from ..worklog import (
 )
 
 
-def format_duration(seconds: int) -> str:
-    """Format duration in seconds to human-readable string."""
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
-    if hours > 0:
-        return f"{hours}h {minutes}m {secs}s"
-    elif minutes > 0:
-        return f"{minutes}m {secs}s"
-    else:
-        return f"{secs}s"
-
-
 class WorklogMixin:
     """Mixin for worklog task management in TUI."""
 
@@ -61,6 +46,10 @@ class WorklogMixin:
     _show_history: bool
     _last_working_task_id: str | None
     _refreshing_task_tree: bool
+    # Task id -> (header, details) labels of the session boxes on the dashboard
+    _dashboard_cards: dict[str, tuple[Static, Static]] | None
+    # Task id -> top-level node of the task tree, rebuilt with the tree
+    _task_nodes: dict[str, TreeNode]
 
     def _init_worklog(self) -> None:
         """Initialize worklog state."""
@@ -71,12 +60,11 @@ class WorklogMixin:
             needs_session = not hasattr(self, "_task_selected_session_index")
             if (
                 (needs_task_state or needs_selection or needs_session)
-                and hasattr(self, "_ui_state_path")
+                and hasattr(self, "_read_ui_state")
                 and hasattr(self, "_get_project_state_key")
             ):
-                if self._ui_state_path.exists():
-                    with open(self._ui_state_path) as f:
-                        all_state = yaml.safe_load(f) or {}
+                all_state = self._read_ui_state()
+                if all_state:
                     project_key = self._get_project_state_key()
                     data = all_state.get(project_key, {})
                     if needs_task_state:
@@ -116,6 +104,8 @@ class WorklogMixin:
         if not hasattr(self, "_task_expanded_ids"):
             self._task_expanded_ids = set()
         self._refreshing_task_tree = False
+        self._dashboard_cards = None
+        self._task_nodes = {}
         if not hasattr(self, "_task_tree_last_interaction"):
             self._task_tree_last_interaction = 0.0
 
@@ -162,7 +152,7 @@ class WorklogMixin:
                 and node.data.get("id") == task_id
             ):
                 if expand:
-                    node.expand()
+                    self._expand_task_node(node)
                     if hasattr(self, "_task_expanded_ids"):
                         self._task_expanded_ids.add(str(task_id))
                 elif collapse:
@@ -187,7 +177,7 @@ class WorklogMixin:
                 and node.data.get("id") == task_id
             ):
                 if not node.is_expanded:
-                    node.expand()
+                    self._expand_task_node(node)
                 if 0 <= session_index < len(node.children):
                     session_node = node.children[session_index]
                     tree.select_node(session_node)
@@ -235,11 +225,11 @@ class WorklogMixin:
             should_expand = True
 
         if should_expand and not task_node.is_expanded:
-            task_node.expand()
+            self._expand_task_node(task_node)
 
         if self._selected_session_index is not None:
             if not task_node.is_expanded:
-                task_node.expand()
+                self._expand_task_node(task_node)
             if 0 <= self._selected_session_index < len(task_node.children):
                 session_node = task_node.children[self._selected_session_index]
                 tree.select_node(session_node)
@@ -278,36 +268,29 @@ class WorklogMixin:
 
             tree.clear()
             tree.root.expand()
+            self._task_nodes = {}
 
             # Show all tasks
             tasks_to_show = self._worklog.tasks
+            # One clock reading for every active session in the tree
+            now = datetime.now()
 
             # Add tasks to tree
             for task in tasks_to_show:
-                task_label = self._format_task_label(task)
+                task_label = self._format_task_label(task, now)
                 task_node = tree.root.add(
                     task_label, data={"type": "task", "id": task.id}
                 )
+                self._task_nodes[str(task.id)] = task_node
 
                 # Restore expansion state for this task.
                 # Only expand if explicitly in expanded set; do not auto-expand on selection.
+                # Session nodes of collapsed tasks are added on first expansion.
                 task_id_str = str(task.id)
                 should_expand = task_id_str in expanded_task_ids
 
-                # Add sessions as children
-                for idx, session in enumerate(task.sessions):
-                    session_label = self._format_session_label(session, idx)
-                    session_node = task_node.add(
-                        session_label,
-                        data={
-                            "type": "session",
-                            "task_id": task.id,
-                            "session_index": idx,
-                        },
-                    )
-                    # Note: TreeNode doesn't support CSS classes, colors are in the label text via format_session_label
-
                 if should_expand:
+                    self._add_session_nodes(task_node, task, now)
                     task_node.expand()
                     # Explicitly track expansion state since expand events may not fire immediately
                     if hasattr(self, "_task_expanded_ids"):
@@ -318,17 +301,41 @@ class WorklogMixin:
             # Clear refresh flag to allow normal collapse/expand event handling
             self._refreshing_task_tree = False
 
-    def _format_task_label(self, task: Task) -> str:
+    def _expand_task_node(self, node: TreeNode) -> None:
+        """Expand a task node, adding its session nodes first if needed."""
+        task = self._get_task(node.data.get("id")) if node.data else None
+        if task is not None:
+            self._add_session_nodes(node, task)
+        node.expand()
+
+    def _add_session_nodes(
+        self, node: TreeNode, task: Task, now: datetime | None = None
+    ) -> None:
+        """Add the session children of a task node unless it already has them."""
+        if node.children:
+            return
+        now = now or datetime.now()
+        for idx, session in enumerate(task.sessions):
+            # Note: TreeNode doesn't support CSS classes, colors are in the label text via format_session_label
+            node.add(
+                self._format_session_label(session, idx, now),
+                data={
+                    "type": "session",
+                    "task_id": task.id,
+                    "session_index": idx,
+                },
+            )
+
+    def _format_task_label(self, task: Task, now: datetime | None = None) -> str:
         """Format task as tree label."""
-        total_duration = format_duration(task.total_duration_seconds())
+        now = now or datetime.now()
+        total_duration = format_duration(task.total_duration_seconds(now))
 
         # Status indicator with blinking for active tasks
         status_icon = ""
         if task.is_active():
             # Blink between green and black for active sessions
-            import time
-
-            blink_on = int(time.time()) % 2 == 0
+            blink_on = int(now.timestamp()) % 2 == 0
             status_icon = "🟢" if blink_on else "⚫"
         elif task.status == LogTaskStatus.completed:
             status_icon = "✅"
@@ -364,7 +371,9 @@ class WorklogMixin:
             return f"{base}: {task.sub_category.value}"
         return base
 
-    def _format_session_label(self, session, index: int) -> str:
+    def _format_session_label(
+        self, session, index: int, now: datetime | None = None
+    ) -> str:
         """Format session as tree label."""
         punch_in_str = session.punch_in.strftime("%Y-%m-%d %H:%M")
         punch_out_str = (
@@ -379,7 +388,7 @@ class WorklogMixin:
         note_str = f' "{session.note}"' if session.note else ""
 
         # Check if problematic
-        is_prob, reason = session.is_problematic()
+        is_prob, reason = session.is_problematic(now)
         warning = ""
         if is_prob:
             if reason == "invalid_times":
@@ -407,37 +416,57 @@ class WorklogMixin:
 
         return "session-normal"  # Green
 
-    def _update_dashboard(self) -> None:
-        """Update dashboard display with all active sessions."""
-        from textual.containers import Horizontal, Vertical
-        from textual.widgets import Button, Static
+    def _update_dashboard(
+        self, active_tasks: list[Task] | None = None, now: datetime | None = None
+    ) -> None:
+        """Update dashboard display with all active sessions.
 
+        Session boxes are only rebuilt when the set of active tasks changes;
+        otherwise the existing header and details labels are updated in place.
+        """
         try:
             container = self.query_one("#dashboard_sessions_container", Vertical)
         except Exception:
             return
 
-        # Clear existing content - use await remove so it completes before mounting new widgets
-        if container._nodes:
-            for child in list(container._nodes):
-                child.remove()
-
         # Find all active tasks
-        active_tasks = self._worklog.active_tasks()
+        if active_tasks is None:
+            active_tasks = self._worklog.active_tasks()
+        active = [
+            (task, session)
+            for task in active_tasks
+            if (session := task.active_session())
+        ]
 
-        if not active_tasks:
-            # No active sessions
-            no_sessions = Static("No active sessions", classes="muted-text")
-            container.mount(no_sessions)
+        # Add blinking indicator calculation
+        now = now or datetime.now()
+        blink_on = int(now.timestamp()) % 2 == 0
+        indicator = "🟢" if blink_on else "⚫"
+
+        labels = {}
+        for task, active_session in active:
+            # Calculate elapsed time
+            elapsed = active_session.duration_seconds(now)
+            total = task.total_duration_seconds(now)
+            tag = self._task_category_tag(task)
+            labels[task.id] = (
+                f"{indicator} [{tag}] {task.name}",
+                f"⏱ Session: {format_duration(elapsed)}  │  📊 Task total: {format_duration(total)}",
+            )
+
+        cards = self._dashboard_cards
+        if cards is not None and list(cards) == list(labels):
+            for task_id, (header_text, details_text) in labels.items():
+                header, details = cards[task_id]
+                header.update(header_text)
+                details.update(details_text)
             return
 
         # Clear existing content
         container.remove_children()
+        self._dashboard_cards = {}
 
-        # Find all active tasks
-        active_tasks = self._worklog.active_tasks()
-
-        if not active_tasks:
+        if not labels:
             # No active sessions
             no_sessions = Static(
                 "No active sessions", id="no_sessions_message", classes="muted-text"
@@ -445,38 +474,15 @@ class WorklogMixin:
             container.mount(no_sessions)
             return
 
-        # Add blinking indicator calculation
-        import time
-
-        blink_on = int(time.time()) % 2 == 0
-        indicator = "🟢" if blink_on else "⚫"
-
         # Create a session widget for each active task
-        for task in active_tasks:
-            active_session = task.active_session()
-            if not active_session:
-                continue
-
-            # Calculate elapsed time
-            elapsed = active_session.duration_seconds()
-            total = task.total_duration_seconds()
-
-            tag = self._task_category_tag(task)
-
+        for task_id, (header_text, details_text) in labels.items():
             # Create session box container and mount it first
             session_box = Vertical(classes="session-box")
             container.mount(session_box)
 
-            # Session header with task info
-            header = Static(
-                f"{indicator} [{tag}] {task.name}", classes="session-header"
-            )
-
-            # Session details
-            details = Static(
-                f"⏱ Session: {format_duration(elapsed)}  │  📊 Task total: {format_duration(total)}",
-                classes="session-details",
-            )
+            # Session header with task info and session details
+            header = Static(header_text, classes="session-header")
+            details = Static(details_text, classes="session-details")
 
             # Build session box with all components
             session_box.mount(header)
@@ -489,19 +495,20 @@ class WorklogMixin:
             # Now mount buttons to the attached container
             check_out_btn = Button(
                 "Check Out (I)",
-                id=f"session_check_out_{task.id}",
+                id=f"session_check_out_{task_id}",
                 variant="primary",
                 classes="session-btn",
             )
             add_note_btn = Button(
                 "Add Note (N)",
-                id=f"session_add_note_{task.id}",
+                id=f"session_add_note_{task_id}",
                 variant="default",
                 classes="session-btn",
             )
 
             buttons_container.mount(check_out_btn)
             buttons_container.mount(add_note_btn)
+            self._dashboard_cards[task_id] = (header, details)
 
     def _on_tree_node_selected(self, node: TreeNode) -> None:
         """Handle tree node selection."""
@@ -575,7 +582,7 @@ class WorklogMixin:
                 }
 
         result = await self.push_screen_wait(
-            TaskModal(
+            screens.TaskModal(
                 compute_locations=["Local", "HPC-GPU", "HPC-CPU", "Workstation"],
                 initial_data=initial_data,
                 project_root=self._project_root,
@@ -712,7 +719,7 @@ class WorklogMixin:
         if not active_session:
             return
 
-        result = await self.push_screen_wait(SessionNoteModal())
+        result = await self.push_screen_wait(screens.SessionNoteModal())
         if result and result.get("note"):
             # Find session index
             session_idx = len(task.sessions) - 1
@@ -745,7 +752,7 @@ class WorklogMixin:
         if not active_session:
             return
 
-        result = await self.push_screen_wait(SessionNoteModal())
+        result = await self.push_screen_wait(screens.SessionNoteModal())
         if result and result.get("note"):
             # Find session index
             session_idx = len(task.sessions) - 1
@@ -770,7 +777,7 @@ class WorklogMixin:
             # Edit session
             session = task.sessions[self._selected_session_index]
             result = await self.push_screen_wait(
-                EditSessionModal(
+                screens.EditSessionModal(
                     task_name=task.name,
                     initial_punch_in=session.punch_in,
                     initial_punch_out=session.punch_out,
@@ -827,7 +834,7 @@ class WorklogMixin:
             }
 
             result = await self.push_screen_wait(
-                TaskModal(
+                screens.TaskModal(
                     initial_data=initial_data,
                     allow_remove=True,
                     project_root=self._project_root,
@@ -911,28 +918,31 @@ class WorklogMixin:
             # Selection restoration is handled during refresh; no extra timer needed.
             pass
 
-    def _update_active_task_labels(self) -> None:
+    def _update_active_task_labels(
+        self, active_tasks: list[Task], now: datetime | None = None
+    ) -> None:
         """Update labels for active tasks to show blinking indicator without full tree rebuild."""
-        try:
-            tree = self.query_one("#task_tree", Tree)
-        except Exception:
-            return
-
-        # Update labels for task nodes with active sessions
-        for node in tree.root.children:
-            if node.data and node.data.get("type") == "task":
-                task_id = node.data.get("id")
-                if task_id:
-                    task = self._get_task(task_id)
-                    if task and task.active_session():
-                        # Update the label with new blinking state
-                        node.label = self._format_task_label(task)
+        for task in active_tasks:
+            node = self._task_nodes.get(str(task.id))
+            if node is None:
+                continue
+            # Update the label with new blinking state
+            label = self._format_task_label(task, now)
+            if str(node.label) != label:
+                node.label = label
 
     def _tick_worklog(self) -> None:
-        """Periodic update for dashboard and tree (called every second)."""
+        """Periodic update for dashboard and tree (called every second).
+
+        Only active tasks change from one tick to the next, so neither the
+        dashboard nor the tree is rebuilt here; mutating handlers do that
+        through ``_load_worklog_data``.
+        """
+        active_tasks = self._worklog.active_tasks()
+        now = datetime.now()
         # Update dashboard to refresh elapsed time for active session
-        self._update_dashboard()
+        self._update_dashboard(active_tasks, now)
 
         # Update blinking indicators for active tasks (lightweight, no tree rebuild)
-        if self._worklog.active_tasks():
-            self._update_active_task_labels()
+        if active_tasks:
+            self._update_active_task_labels(active_tasks, now)
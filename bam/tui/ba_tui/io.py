@@ -1,18 +1,20 @@
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Any
 
 import yaml
 from pydantic import ValidationError
 
+from .config import SafeDumper, SafeLoader
 from .models import Manifest, ManifestValidationError, raise_validation_error
 
 
 def load_manifest(path: Path) -> Manifest | None:
     if not path.exists():
         return None
-    data = yaml.safe_load(path.read_text()) or {}
+    data = yaml.load(path.read_bytes(), Loader=SafeLoader) or {}
     if not data:
         return None
     try:
@@ -23,4 +25,18 @@ def load_manifest(path: Path) -> Manifest | None:
 
 def dump_manifest(path: Path, manifest: Manifest) -> None:
     payload: dict[str, Any] = manifest.model_dump(mode="json", exclude_none=True)
-    yaml.safe_dump(payload, path.open("w"), sort_keys=False)
+    write_manifest_bytes(
+        path, yaml.dump(payload, Dumper=SafeDumper, sort_keys=False, encoding="utf-8")
+    )
+
+
+def write_manifest_bytes(path: Path, data: bytes) -> None:
+    """Write an already serialized manifest with raw writes and an fsync."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            view = view[os.write(fd, view) :]
+        os.fsync(fd)
+    finally:
+        os.close(fd)
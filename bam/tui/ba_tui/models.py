@@ -713,11 +713,14 @@ class Session(BaseModel):
     punch_out: Optional[datetime] = None
     note: Optional[str] = None
 
-    def duration_seconds(self) -> int:
-        """Calculate session duration in seconds."""
+    def duration_seconds(self, now: Optional[datetime] = None) -> int:
+        """Calculate session duration in seconds.
+
+        Callers timing many sessions can pass one shared ``now``.
+        """
         if self.punch_out is None:
             # Active session - calculate from punch_in to now
-            delta = datetime.now() - self.punch_in
+            delta = (now or datetime.now()) - self.punch_in
             return int(delta.total_seconds())
         else:
             delta = self.punch_out - self.punch_in
@@ -729,7 +732,7 @@ class Session(BaseModel):
             return True
         return self.punch_out > self.punch_in
 
-    def is_problematic(self) -> tuple[bool, str]:
+    def is_problematic(self, now: Optional[datetime] = None) -> tuple[bool, str]:
         """Check if session has issues (>24h, invalid times, etc.).
 
         Returns:
@@ -743,7 +746,7 @@ class Session(BaseModel):
         if self.punch_out is None:
             # Check if active session is >24h old
             hours_since_punch_in = (
-                datetime.now() - self.punch_in
+                (now or datetime.now()) - self.punch_in
             ).total_seconds() / 3600
             if hours_since_punch_in > 24:
                 return (True, "no_punch_out_24h")
@@ -775,9 +778,10 @@ class Task(BaseModel):
     sessions: list[Session] = Field(default_factory=list)
     created: datetime = Field(default_factory=datetime.now)
 
-    def total_duration_seconds(self) -> int:
+    def total_duration_seconds(self, now: Optional[datetime] = None) -> int:
         """Calculate total time across all sessions."""
-        return sum(session.duration_seconds() for session in self.sessions)
+        now = now or datetime.now()
+        return sum(session.duration_seconds(now) for session in self.sessions)
 
     def active_session(self) -> Optional[Session]:
         """Get currently active session (no punch_out)."""
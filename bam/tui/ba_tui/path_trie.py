@@ -0,0 +1,168 @@
+"""Prefix index over directory entries for path autocompletion."""
+
+from __future__ import annotations
+
+import asyncio
+import heapq
+import os
+import threading
+from itertools import count
+from pathlib import Path
+
+_MAX_CACHED_DIRS = 64
+# Typing pause before a directory is listed; newer keystrokes cancel the lookup.
+_SUGGEST_DEBOUNCE_S = 0.05
+
+
+class _Node:
+    __slots__ = ("label", "children", "values", "best")
+
+    def __init__(self, label: str) -> None:
+        self.label = label
+        self.children: dict[str, _Node] = {}
+        self.values: list[tuple[int, tuple[str, str]]] = []
+        self.best = -1
+
+
+class PathTrie:
+    """Radix trie keyed on lowercased entry names.
+
+    Every node records the best (lowest) rank in its subtree, so a top-k
+    lookup walks subtrees best-first and stops as soon as k values are found.
+    """
+
+    __slots__ = ("_root",)
+
+    def __init__(self) -> None:
+        self._root = _Node("")
+
+    def insert(self, key: str, rank: int, value: tuple[str, str]) -> None:
+        node = self._root
+        if node.best < 0 or rank < node.best:
+            node.best = rank
+        while key:
+            child = node.children.get(key[0])
+            if child is None:
+                leaf = _Node(key)
+                leaf.best = rank
+                leaf.values.append((rank, value))
+                node.children[key[0]] = leaf
+                return
+            label = child.label
+            common = 1
+            limit = min(len(label), len(key))
+            while common < limit and label[common] == key[common]:
+                common += 1
+            if common < len(label):
+                split = _Node(label[:common])
+                split.best = child.best
+                child.label = label[common:]
+                split.children[child.label[0]] = child
+                node.children[key[0]] = split
+                child = split
+            if rank < child.best:
+                child.best = rank
+            node = child
+            key = key[common:]
+        node.values.append((rank, value))
+
+    def top_k(self, prefix: str, k: int) -> list[tuple[str, str]]:
+        node = self._root
+        rest = prefix
+        while rest:
+            child = node.children.get(rest[0])
+            if child is None:
+                return []
+            label = child.label
+            if label.startswith(rest):
+                node = child
+                break
+            if not rest.startswith(label):
+                return []
+            rest = rest[len(label):]
+            node = child
+        if node.best < 0:
+            return []
+
+        tiebreak = count()
+        heap: list[tuple[int, int, object]] = [(node.best, next(tiebreak), node)]
+        results: list[tuple[str, str]] = []
+        while heap and len(results) < k:
+            _, _, item = heapq.heappop(heap)
+            if isinstance(item, _Node):
+                for rank, value in item.values:
+                    heapq.heappush(heap, (rank, next(tiebreak), value))
+                for child in item.children.values():
+                    heapq.heappush(heap, (child.best, next(tiebreak), child))
+            else:
+                results.append(item)
+        return results
+
+
+_trie_cache: dict[str, tuple[int, PathTrie]] = {}
+# Lookups run on worker threads, so the LRU reordering must not interleave
+_TRIE_CACHE_LOCK = threading.Lock()
+
+
+def directory_trie(directory: Path) -> PathTrie | None:
+    """Return the trie for ``directory``, rebuilding it when its mtime changes."""
+    key = str(directory)
+    try:
+        mtime_ns = os.stat(key).st_mtime_ns
+    except OSError:
+        return None
+    with _TRIE_CACHE_LOCK:
+        cached = _trie_cache.pop(key, None)
+        if cached is not None and cached[0] == mtime_ns:
+            # Re-insert so the dict stays ordered from least to most recently used
+            _trie_cache[key] = cached
+            return cached[1]
+
+    try:
+        with os.scandir(key) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
+    except OSError:
+        return None
+
+    trie = PathTrie()
+    for rank, entry in enumerate(entries):
+        name = entry.name
+        try:
+            is_dir = entry.is_dir()
+        except OSError:
+            is_dir = False
+        display = f"📁 {name}/" if is_dir else f"📄 {name}"
+        trie.insert(name.lower(), rank, (str(directory / name), display))
+
+    with _TRIE_CACHE_LOCK:
+        if len(_trie_cache) >= _MAX_CACHED_DIRS:
+            _trie_cache.pop(next(iter(_trie_cache)), None)
+        _trie_cache[key] = (mtime_ns, trie)
+    return trie
+
+
+def suggest_paths(current_value: str, limit: int = 20) -> list[tuple[str, str]]:
+    """Return up to ``limit`` ``(path, display_name)`` completions for a typed path."""
+    path = Path(current_value).expanduser()
+    if path.is_dir():
+        search_dir = path
+        prefix = ""
+    else:
+        search_dir = path.parent
+        prefix = path.name.lower()
+    trie = directory_trie(search_dir)
+    if trie is None:
+        return []
+    return trie.top_k(prefix, limit)
+
+
+async def suggest_paths_async(
+    current_value: str, limit: int = 20
+) -> list[tuple[str, str]]:
+    """Debounced :func:`suggest_paths` that lists directories off the event loop.
+
+    Run it in an exclusive worker so a newer keystroke cancels the pending one;
+    slow network mounts then never stall rendering.
+    """
+    await asyncio.sleep(_SUGGEST_DEBOUNCE_S)
+    return await asyncio.to_thread(suggest_paths, current_value, limit)
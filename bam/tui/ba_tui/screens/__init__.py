@@ -1,39 +1,63 @@
-"""Screen and modal exports."""
+"""Screen and modal exports.
 
-from .acquisition import AcquisitionSessionModal
-from .channel import ChannelModal
-from .collaborator import CollaboratorModal
-from .confirm import ExitConfirmScreen, NewManifestConfirmScreen, ResetConfirmScreen
-from .custom_input import CustomInputModal
-from .artifact import ArtifactModal
-from .dataset import DatasetModal
-from .delete_confirm import DeleteConfirmModal
-from .directory_picker import DirectoryPickerScreen
-from .edit_session_modal import EditSessionModal
-from .figure_element import FigureElementModal
-from .figure_node import FigureNodeModal
-from .hardware import HardwareModal
-from .milestone import MilestoneModal
-from .session_note_modal import SessionNoteModal
-from .task_modal import TaskModal
+Modals are imported on first access so that modes which never open them
+do not pay for their modules at startup.
+"""
 
-__all__ = [
-    "AcquisitionSessionModal",
-    "ChannelModal",
-    "CollaboratorModal",
-    "CustomInputModal",
-    "ArtifactModal",
-    "DatasetModal",
-    "DeleteConfirmModal",
-    "DirectoryPickerScreen",
-    "EditSessionModal",
-    "ExitConfirmScreen",
-    "FigureElementModal",
-    "FigureNodeModal",
-    "HardwareModal",
-    "MilestoneModal",
-    "NewManifestConfirmScreen",
-    "ResetConfirmScreen",
-    "SessionNoteModal",
-    "TaskModal",
-]
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from .acquisition import AcquisitionSessionModal
+    from .artifact import ArtifactModal
+    from .channel import ChannelModal
+    from .collaborator import CollaboratorModal
+    from .confirm import (
+        ExitConfirmScreen,
+        NewManifestConfirmScreen,
+        ResetConfirmScreen,
+    )
+    from .custom_input import CustomInputModal
+    from .dataset import DatasetModal
+    from .delete_confirm import DeleteConfirmModal
+    from .directory_picker import DirectoryPickerScreen
+    from .edit_session_modal import EditSessionModal
+    from .figure_element import FigureElementModal
+    from .figure_node import FigureNodeModal
+    from .hardware import HardwareModal
+    from .milestone import MilestoneModal
+    from .session_note_modal import SessionNoteModal
+    from .task_modal import TaskModal
+
+# Exported name -> submodule defining it
+_EXPORTS = {
+    "AcquisitionSessionModal": "acquisition",
+    "ArtifactModal": "artifact",
+    "ChannelModal": "channel",
+    "CollaboratorModal": "collaborator",
+    "CustomInputModal": "custom_input",
+    "DatasetModal": "dataset",
+    "DeleteConfirmModal": "delete_confirm",
+    "DirectoryPickerScreen": "directory_picker",
+    "EditSessionModal": "edit_session_modal",
+    "ExitConfirmScreen": "confirm",
+    "FigureElementModal": "figure_element",
+    "FigureNodeModal": "figure_node",
+    "HardwareModal": "hardware",
+    "MilestoneModal": "milestone",
+    "NewManifestConfirmScreen": "confirm",
+    "ResetConfirmScreen": "confirm",
+    "SessionNoteModal": "session_note_modal",
+    "TaskModal": "task_modal",
+}
+
+__all__ = sorted(_EXPORTS)
+
+
+def __getattr__(name: str) -> Any:
+    module = _EXPORTS.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(import_module(f".{module}", __name__), name)
+    globals()[name] = value
+    return value
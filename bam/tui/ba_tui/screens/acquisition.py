@@ -29,6 +29,7 @@ class AcquisitionSessionModal(FormModal):
         ("DIC", "dic"),
         ("Other", "other"),
     ]
+    _KNOWN_MODALITIES = frozenset(value for _, value in MODALITY_OPTIONS)
 
     def __init__(
         self, initial_data: dict[str, object] | None = None, allow_remove: bool = False
@@ -64,7 +65,9 @@ class AcquisitionSessionModal(FormModal):
                     modality_value = self.initial_data.get("modality")
                     yield Select(
                         self.MODALITY_OPTIONS,
-                        value=modality_value if modality_value else Select.BLANK,
+                        value=modality_value
+                        if modality_value in self._KNOWN_MODALITIES
+                        else Select.BLANK,
                         allow_blank=True,
                         id="session_modality",
                     )
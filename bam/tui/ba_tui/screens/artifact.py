@@ -7,7 +7,9 @@ from textual.containers import Horizontal, Vertical, VerticalScroll
 from textual.widgets import Button, Checkbox, Input, Label, OptionList, Select, Static
 from textual.widgets.option_list import Option
 
+from ..path_trie import suggest_paths_async
 from ..styles import ARTIFACT_MODAL_CSS
+from ..widgets import select_or_custom
 from .base import FormModal
 from .directory_picker import DirectoryPickerScreen
 
@@ -270,39 +272,24 @@ class ArtifactModal(FormModal):
         self._browse_target = None
 
     def _update_path_suggestions(self, current_value: str) -> None:
+        if not current_value:
+            self._hide_path_suggestions()
+            return
+        self.run_worker(
+            self._fill_path_suggestions(current_value),
+            exclusive=True,
+            group="artifact_path_suggestions",
+        )
+
+    async def _fill_path_suggestions(self, current_value: str) -> None:
         try:
+            entries = await suggest_paths_async(current_value)
             suggestions = self.query_one("#artifact_path_suggestions", OptionList)
             suggestions.clear_options()
-            if not current_value:
-                self._hide_path_suggestions()
-                return
-            path = Path(current_value).expanduser()
-            if path.is_dir():
-                search_dir = path
-                prefix = ""
-            else:
-                search_dir = path.parent
-                prefix = path.name.lower()
-            if not search_dir.exists():
-                self._hide_path_suggestions()
-                return
-            entries: list[tuple[str, str]] = []
-            try:
-                # Collect both directories and files
-                for entry in sorted(search_dir.iterdir()):
-                    name = entry.name
-                    if not prefix or name.lower().startswith(prefix):
-                        if entry.is_dir():
-                            entries.append((str(entry), f"📁 {name}/"))
-                        else:
-                            entries.append((str(entry), f"📄 {name}"))
-                        if len(entries) >= 20:
-                            break
-            except PermissionError:
-                pass
             if entries:
-                for entry_path, display_name in entries:
-                    suggestions.add_option(Option(display_name, id=entry_path))
+                suggestions.add_options(
+                    [Option(name, id=entry_path) for entry_path, name in entries]
+                )
                 suggestions.add_class("visible")
                 self._path_suggestions_visible = True
             else:
@@ -311,6 +298,7 @@ class ArtifactModal(FormModal):
             self._hide_path_suggestions()
 
     def _hide_path_suggestions(self) -> None:
+        self.workers.cancel_group(self, "artifact_path_suggestions")
         try:
             suggestions = self.query_one("#artifact_path_suggestions", OptionList)
             suggestions.remove_class("visible")
@@ -325,17 +313,10 @@ class ArtifactModal(FormModal):
             self.notify("Path is required", severity="error")
             return
 
-        endpoint_value = self.query_one("#artifact_endpoint", Select).value
-        endpoint_custom = self.query_one(
-            "#artifact_endpoint_custom", Input
-        ).value.strip()
-        endpoint = ""
-        if endpoint_value and endpoint_value != Select.BLANK:
-            endpoint = str(endpoint_value)
-        if endpoint.lower() == "other" and endpoint_custom:
-            endpoint = endpoint_custom
-        elif not endpoint and endpoint_custom:
-            endpoint = endpoint_custom
+        endpoint = select_or_custom(
+            self.query_one("#artifact_endpoint", Select),
+            self.query_one("#artifact_endpoint_custom", Input),
+        )
 
         data = {
             "endpoint": endpoint,
@@ -5,6 +5,7 @@ from textual.containers import Horizontal, Vertical
 from textual.widgets import Input, Label, Select, Static
 
 from ..styles import COLLABORATOR_MODAL_CSS
+from ..widgets import select_or_custom
 from .base import FormModal
 
 
@@ -106,15 +107,9 @@ class CollaboratorModal(FormModal):
             self.notify("Name is required", severity="error")
             return
 
-        selected_role = self.query_one("#role", Select).value
-        custom_role = self.query_one("#role_custom", Input).value.strip()
-        role_value = ""
-        if selected_role and selected_role != Select.BLANK:
-            role_value = str(selected_role)
-        if role_value.lower() == "other" and custom_role:
-            role_value = custom_role
-        elif not role_value and custom_role:
-            role_value = custom_role
+        role_value = select_or_custom(
+            self.query_one("#role", Select), self.query_one("#role_custom", Input)
+        )
 
         data = {
             "name": name,
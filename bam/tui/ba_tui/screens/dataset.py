@@ -15,10 +15,14 @@ from textual.widgets import (
 )
 
 from ..styles import DATASET_MODAL_CSS
+from ..widgets import select_or_custom
 from .base import FormModal
 from .directory_picker import DirectoryPickerScreen
 from .path_suggestions import PathSuggestionsMixin
 
+# Sizes are plain decimals; Input applies this regex to each edit natively.
+_SIZE_PATTERN = r"[0-9.]*"
+
 
 class DatasetModal(PathSuggestionsMixin, FormModal):
     """Modal to add or edit a dataset."""
@@ -194,6 +198,7 @@ class DatasetModal(PathSuggestionsMixin, FormModal):
                     yield Input(
                         str(self.initial_data.get("raw_size_gb", "")),
                         id="raw_size_gb",
+                        restrict=_SIZE_PATTERN,
                         placeholder="Approximate raw data size",
                     )
                     yield Select(
@@ -219,6 +224,7 @@ class DatasetModal(PathSuggestionsMixin, FormModal):
                     yield Input(
                         str(self.initial_data.get("uncompressed_size_gb", "")),
                         id="uncompressed_size_gb",
+                        restrict=_SIZE_PATTERN,
                         placeholder="Uncompressed size",
                     )
                     yield Select(
@@ -369,25 +375,14 @@ class DatasetModal(PathSuggestionsMixin, FormModal):
             self.notify("Name is required", severity="error")
             return
 
-        endpoint_value = self.query_one("#endpoint", Select).value
-        endpoint_custom = self.query_one("#endpoint_custom", Input).value.strip()
-        endpoint = ""
-        if endpoint_value and endpoint_value != Select.BLANK:
-            endpoint = str(endpoint_value)
-        if endpoint.lower() == "other" and endpoint_custom:
-            endpoint = endpoint_custom
-        elif not endpoint and endpoint_custom:
-            endpoint = endpoint_custom
-
-        format_value = self.query_one("#format", Select).value
-        format_custom = self.query_one("#format_custom", Input).value.strip()
-        data_format = ""
-        if format_value and format_value != Select.BLANK:
-            data_format = str(format_value)
-        if data_format.lower() == "other" and format_custom:
-            data_format = format_custom
-        elif not data_format and format_custom:
-            data_format = format_custom
+        endpoint = select_or_custom(
+            self.query_one("#endpoint", Select),
+            self.query_one("#endpoint_custom", Input),
+        )
+        data_format = select_or_custom(
+            self.query_one("#format", Select),
+            self.query_one("#format_custom", Input),
+        )
 
         data = {
             "name": name,
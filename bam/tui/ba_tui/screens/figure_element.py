@@ -236,57 +236,6 @@ class FigureElementModal(PathSuggestionsMixin, FormModal):
         except Exception:
             pass
 
-    def _update_path_suggestions(self, input_id: str, current_value: str) -> None:
-        """Override to show both files and directories."""
-        try:
-            from pathlib import Path
-            from textual.widgets.option_list import Option
-
-            suggestions = self.query_one(f"#{input_id}_suggestions", OptionList)
-            suggestions.clear_options()
-
-            if not current_value:
-                self._hide_path_suggestions(input_id)
-                return
-
-            path = Path(current_value).expanduser()
-            if path.is_dir():
-                search_dir = path
-                prefix = ""
-            else:
-                search_dir = path.parent
-                prefix = path.name.lower()
-
-            if not search_dir.exists():
-                self._hide_path_suggestions(input_id)
-                return
-
-            entries = []
-            try:
-                # Collect both directories and files
-                for entry in sorted(search_dir.iterdir()):
-                    name = entry.name
-                    if not prefix or name.lower().startswith(prefix):
-                        if entry.is_dir():
-                            entries.append((str(entry), f"📁 {name}/"))
-                        else:
-                            entries.append((str(entry), f"📄 {name}"))
-                        if len(entries) >= 20:
-                            break
-            except PermissionError:
-                pass
-
-            if entries:
-                for entry_path, display_name in entries:
-                    suggestions.add_option(Option(display_name, id=entry_path))
-                suggestions.add_class("visible")
-                self._path_suggestions_visible[input_id] = True
-                self._active_path_input = input_id
-            else:
-                self._hide_path_suggestions(input_id)
-        except Exception:
-            self._hide_path_suggestions(input_id)
-
     def _open_directory_picker(self, target_input_id: str) -> None:
         from pathlib import Path
 
@@ -5,6 +5,8 @@ from typing import Optional
 from textual.widgets import Checkbox, Input, OptionList
 from textual.widgets.option_list import Option
 
+from ..path_trie import suggest_paths_async
+
 
 class PathSuggestionsMixin:
     """Mixin for path suggestions in DatasetModal."""
@@ -80,46 +82,24 @@ class PathSuggestionsMixin:
                 pass
 
     def _update_path_suggestions(self, input_id: str, current_value: str) -> None:
+        if not current_value:
+            self._hide_path_suggestions(input_id)
+            return
+        self.run_worker(
+            self._fill_path_suggestions(input_id, current_value),
+            exclusive=True,
+            group=f"{input_id}_suggestions",
+        )
+
+    async def _fill_path_suggestions(self, input_id: str, current_value: str) -> None:
         try:
+            entries = await suggest_paths_async(current_value)
             suggestions = self.query_one(f"#{input_id}_suggestions", OptionList)
             suggestions.clear_options()
-
-            if not current_value:
-                self._hide_path_suggestions(input_id)
-                return
-
-            from pathlib import Path
-
-            path = Path(current_value).expanduser()
-            if path.is_dir():
-                search_dir = path
-                prefix = ""
-            else:
-                search_dir = path.parent
-                prefix = path.name.lower()
-
-            if not search_dir.exists():
-                self._hide_path_suggestions(input_id)
-                return
-
-            entries = []
-            try:
-                # Collect both directories and files
-                for entry in sorted(search_dir.iterdir()):
-                    name = entry.name
-                    if not prefix or name.lower().startswith(prefix):
-                        if entry.is_dir():
-                            entries.append((str(entry), f"📁 {name}/"))
-                        else:
-                            entries.append((str(entry), f"📄 {name}"))
-                        if len(entries) >= 20:
-                            break
-            except PermissionError:
-                pass
-
             if entries:
-                for entry_path, display_name in entries:
-                    suggestions.add_option(Option(display_name, id=entry_path))
+                suggestions.add_options(
+                    [Option(name, id=entry_path) for entry_path, name in entries]
+                )
                 suggestions.add_class("visible")
                 self._path_suggestions_visible[input_id] = True
                 self._active_path_input = input_id
@@ -129,6 +109,7 @@ class PathSuggestionsMixin:
             self._hide_path_suggestions(input_id)
 
     def _hide_path_suggestions(self, input_id: str) -> None:
+        self.workers.cancel_group(self, f"{input_id}_suggestions")
         try:
             suggestions = self.query_one(f"#{input_id}_suggestions", OptionList)
             suggestions.remove_class("visible")
@@ -14,9 +14,8 @@ from ..models import LogTaskStatus, Task, WorkLog
 
 def format_duration(seconds: int) -> str:
     """Format duration in seconds to human-readable string."""
-    hours = seconds // 3600
-    minutes = (seconds % 3600) // 60
-    secs = seconds % 60
+    minutes, secs = divmod(seconds, 60)
+    hours, minutes = divmod(minutes, 60)
     if hours > 0:
         return f"{hours}h {minutes}m {secs}s"
     elif minutes > 0:
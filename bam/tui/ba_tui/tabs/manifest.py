@@ -4,25 +4,28 @@ from textual.app import ComposeResult
 from textual.containers import VerticalScroll
 from textual.widgets import Static, TabbedContent, TabPane, TextArea
 
+# Top-level manifest keys, each edited as YAML in its own TextArea
+MANIFEST_SECTIONS = (
+    "project",
+    "people",
+    "tags",
+    "data",
+    "acquisition",
+    "tools",
+    "billing",
+    "publication",
+    "archive",
+    "timeline",
+    "artifacts",
+    "hub",
+)
+
 
 def compose_manifest_tab(_: object) -> ComposeResult:
     with TabPane("Manifest (F5)", id="manifest"):
         with VerticalScroll():
             with TabbedContent(id="manifest_sections"):
-                for section in (
-                    "project",
-                    "people",
-                    "tags",
-                    "data",
-                    "acquisition",
-                    "tools",
-                    "billing",
-                    "publication",
-                    "archive",
-                    "timeline",
-                    "artifacts",
-                    "hub",
-                ):
+                for section in MANIFEST_SECTIONS:
                     with TabPane(section.title(), id=f"manifest_{section}"):
                         yield TextArea(id=f"manifest_{section}_area")
             yield Static("", id="manifest_error")
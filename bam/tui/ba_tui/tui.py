@@ -6,9 +6,13 @@ from importlib import metadata
 from pathlib import Path
 from typing import Callable, Optional, cast
 
+from textual import on
 from textual.app import App, ComposeResult
 from textual.binding import Binding
 from textual.containers import Horizontal, Vertical
+from textual.reactive import reactive
+from textual.timer import Timer
+from textual.widget import Widget
 from textual.widgets import (
     Button,
     Checkbox,
@@ -18,6 +22,7 @@ from textual.widgets import (
     Input,
     Label,
     ListView,
+    Markdown,
     OptionList,
     Select,
     SelectionList,
@@ -26,10 +31,12 @@ from textual.widgets import (
     TextArea,
     Tree,
 )
-from textual.widgets.selection_list import Selection
+from textual.widgets.data_table import RowDoesNotExist
+from textual.widgets.option_list import Option
 
 import pendulum
 
+from . import screens
 from .handlers import (
     AcquisitionMixin,
     CollaboratorsMixin,
@@ -50,30 +57,19 @@ from .config import (
     load_endpoint_options,
     load_role_options,
 )
+from .file_watch import FileWatcher
+from .io import load_manifest
+from .path_trie import suggest_paths_async
 from .models import Artifact, FigureElement, FigureNode, Manifest
-from .screens import (
-    AcquisitionSessionModal,
-    ArtifactModal,
-    ChannelModal,
-    CollaboratorModal,
-    CustomInputModal,
-    DatasetModal,
-    DeleteConfirmModal,
-    DirectoryPickerScreen,
-    EditSessionModal,
-    ExitConfirmScreen,
-    FigureElementModal,
-    FigureNodeModal,
-    HardwareModal,
-    MilestoneModal,
-    NewManifestConfirmScreen,
-    ResetConfirmScreen,
-    SessionNoteModal,
-    TaskModal,
-)
 from .styles import APP_CSS, LOG_TAB_CSS
-from .widgets import DateSelect
+from .widgets import (
+    select_or_custom,
+    select_values,
+    sync_table_rows,
+    update_table_row,
+)
 from .utils import detect_git_remote
+from .worklog import init_worklog_manifest_section, migrate_csv_to_yaml
 from .tabs.admin import compose_admin_tab
 from .tabs.hub import compose_hub_tab
 from .tabs.idea import compose_idea_tab
@@ -83,6 +79,157 @@ from .tabs.science import compose_science_tab
 from .tabs.setup import compose_setup_tab
 
 
+# Package metadata is fixed for the lifetime of the process.
+try:
+    _BAM_VERSION = metadata.version("bam")
+except metadata.PackageNotFoundError:
+    _BAM_VERSION = "unknown"
+
+# Editable table row shapes: key -> default. Values are coerced to the
+# default's type (str or bool) when rows are built from manifest defaults.
+_COLLABORATOR_FIELDS: dict[str, str | bool] = {
+    "name": "",
+    "role": "",
+    "email": "",
+    "affiliation": "",
+}
+_DATASET_FIELDS: dict[str, str | bool] = {
+    "name": "",
+    "endpoint": "",
+    "source": "",
+    "local": "",
+    "locally_mounted": False,
+    "description": "",
+    "format": "",
+    "image_quality": "",
+    "raw_size_gb": "",
+    "raw_size_unit": "gb",
+    "compressed": False,
+    "uncompressed_size_gb": "",
+    "uncompressed_size_unit": "gb",
+}
+_HARDWARE_FIELDS: dict[str, str | bool] = {
+    "name": "",
+    "cpu": "",
+    "cores": "",
+    "ram": "",
+    "gpu": "",
+    "notes": "",
+    "is_cluster": False,
+    "partition": "",
+    "node_type": "",
+}
+_CHANNEL_FIELDS: dict[str, str | bool] = {
+    "name": "",
+    "fluorophore": "",
+    "excitation_nm": "",
+    "emission_nm": "",
+}
+
+# Acquisition fields stored as text; imaging_date and channels keep their types
+_ACQUISITION_TEXT_FIELDS = (
+    "microscope",
+    "modality",
+    "objective",
+    "voxel_x",
+    "voxel_y",
+    "voxel_z",
+    "time_interval_s",
+    "notes",
+)
+
+
+def _normalize_rows(
+    items: list[object], fields: dict[str, str | bool]
+) -> list[dict[str, str | bool]]:
+    """Build table rows with exactly ``fields``, coercing values as needed.
+
+    Rows that already have the right keys and value types (the usual case for
+    manifests written by the TUI) are shallow-copied without coercion.
+    """
+    rows: list[dict[str, str | bool]] = []
+    for item in items:
+        if not isinstance(item, dict):
+            rows.append(dict(fields))
+        elif item.keys() == fields.keys() and all(
+            type(item[key]) is type(default) for key, default in fields.items()
+        ):
+            rows.append(dict(item))
+        else:
+            rows.append(
+                {
+                    key: type(default)(item.get(key, default))
+                    for key, default in fields.items()
+                }
+            )
+    return rows
+
+
+# Main tab ids used by the key, save and exit dispatchers.
+_TAB_INIT = "init"
+_TAB_LOG = "log"
+_TAB_IDEA = "idea"
+_TAB_MANIFEST = "manifest"
+_TAB_SETUP = "setup"
+_TAB_SCIENCE = "science"
+_TAB_ADMIN = "admin"
+_TAB_OUTPUTS = "outputs"
+_TAB_HUB = "hub"
+# Tabs whose content is saved into manifest.yaml via _save_init.
+_MANIFEST_EDIT_TABS = frozenset(
+    {_TAB_SETUP, _TAB_SCIENCE, _TAB_ADMIN, _TAB_OUTPUTS, _TAB_HUB}
+)
+
+# Publication inputs collected verbatim, in manifest key order
+_PUBLICATION_INPUTS = (
+    "target_journal",
+    "manuscript_path",
+    "preprint_doi",
+    "published_doi",
+    "github_repo",
+    "zenodo_doi",
+)
+
+# Focused table id -> (add, remove, edit row) handlers for the a/d/enter keys
+_TABLE_KEY_ACTIONS = {
+    "datasets_table": (
+        "action_add_dataset",
+        "action_remove_dataset",
+        "_handle_dataset_row_selected",
+    ),
+    "collaborators_table": (
+        "action_add_collaborator_row",
+        "action_remove_collaborator_row",
+        "_handle_collaborator_row_selected",
+    ),
+    "acquisition_table": (
+        "action_add_acquisition",
+        "action_remove_acquisition",
+        "_handle_acquisition_row_selected",
+    ),
+    "channels_table": (
+        "action_add_channel_row",
+        "action_remove_channel_row",
+        "_handle_channel_row_selected",
+    ),
+    "hardware_table": (
+        "_add_hardware_profile",
+        "_remove_selected_hardware",
+        "_handle_hardware_row_selected",
+    ),
+    "milestones_table": (
+        "action_add_milestone",
+        "action_remove_milestone",
+        "_handle_milestone_row_selected",
+    ),
+    "artifacts_table": (
+        "action_add_artifact",
+        "action_remove_artifact",
+        "_handle_artifact_row_selected",
+    ),
+}
+
+
 def _serialize_figures(figures) -> list[dict[str, object]]:
     def serialize_node(node) -> dict[str, object]:
         if isinstance(node, FigureElement):
@@ -208,6 +355,21 @@ class BAApp(
         Binding("enter", "worklog_edit", "", show=False),
     ]
 
+    # Required init fields; watchers only touch CSS classes on transitions.
+    project_name_valid: reactive[bool] = reactive(False, init=False)
+    analyst_valid: reactive[bool] = reactive(False, init=False)
+
+    # Selects that reveal a free-text row when "Other" is chosen
+    _OTHER_ROWS: dict[str, str] = {
+        "modality": "modality_other_row",
+        "environment": "environment_other_row",
+        "archive_endpoint": "archive_endpoint_custom_row",
+    }
+    # Keys that on_key can act on; everything else (ordinary typing) exits early.
+    _ACTIONABLE_KEYS = frozenset(
+        {"a", "p", "e", "r", "d", "enter", "ctrl+v", "escape", "up", "down"}
+    )
+
     def __init__(
         self,
         *,
@@ -232,6 +394,7 @@ class BAApp(
         self._mode = mode
         self._recent_entries = recent_entries
         self._project_root = project_root or Path.cwd()
+        self._home = Path.home()
         self._defaults = {
             "project_name": project_name,
             "analyst": analyst,
@@ -257,6 +420,8 @@ class BAApp(
         self._task_types = task_types or []
         self._last_click_time: float = 0.0
         self._last_click_row: tuple[str, object] | None = None
+        self._validation_timer: Optional[Timer] = None
+        self._other_row_cache: dict[str, Horizontal] = {}
         self._idea_title = idea_title
         self._artifact_entries: list[Artifact] = artifacts or []
         self._manifest = manifest
@@ -269,18 +434,45 @@ class BAApp(
         self._archive_defaults: dict[str, object] = {}
         self._publication_defaults: dict[str, object] = {}
         self._archive_path_suggestions_visible = False
-        self._archive_path_suggestions = None
+        self._archive_path_suggestions: Optional[OptionList] = None
+        self._tabs: Optional[TabbedContent] = None
+        self._archive_locally_mounted: Optional[Checkbox] = None
         self._manifest_errors: Optional[Static] = None
         self._browse_target: Optional[str] = None
         self._active_method_input: Optional[str] = None
         self._method_path_suggestions_visible = False
         self._method_path_suggestions: Optional[OptionList] = None
-        self._ui_state_path = Path.home() / ".config" / "bam" / "ui_state.yaml"
+        self._method_path_input: Optional[Input] = None
+        self._method_preview_markdown: Optional[Markdown] = None
+        self._form_widget_cache: dict[str, Widget] | None = None
+        self._manifest_area_cache: dict[str, TextArea] | None = None
+        # Section -> (value, text) last written into its manifest TextArea
+        self._manifest_section_text: dict[str, tuple[object, str]] = {}
+        self._manifest_pending_sections: dict[str, object] = {}
+        # Manifest the section TextAreas were loaded from, with its dump
+        self._manifest_sections_source: (
+            tuple[Manifest, dict[str, object]] | None
+        ) = None
+        # Manifest dict written by the last _save_init, keyed by file stat
+        self._manifest_yaml_cache: (
+            tuple[tuple[int, int] | None, dict, bytes] | None
+        ) = None
+        self._ui_state_path = self._home / ".config" / "bam" / "ui_state.json"
+        self._ui_state_written: dict[str, object] | None = None
+        self._project_state_key: str | None = None
         self._hardware_profiles: list[dict[str, str | bool]] = []
         self._method_path: str = ""
         self._method_template_used: str = ""
         self._method_preview_path: str = ""
-        self._method_preview_mtime: float | None = None
+        self._method_preview_stat: tuple[int, int] | None = None
+        self._method_preview_text: Optional[str] = None
+        self._method_preview_visible = False
+        self._method_preview_debounce: Optional[Timer] = None
+        self._method_preview_watcher = FileWatcher(self._on_method_file_changed)
+        self._method_preview_watched = False
+        self._method_preview_flush: Optional[Timer] = None
+        self._method_preview_last_render = 0.0
+        self._tick_count = 0
         self._selected_hardware_index: Optional[int] = None
         self._collaborator_rows: list[dict[str, str]] = []
         self._dataset_rows: list[dict[str, object]] = []
@@ -294,12 +486,7 @@ class BAApp(
         self._channel_rows: list[dict[str, str]] = []
         self._init_channel_rows()
 
-        version = "unknown"
-        try:
-            version = metadata.version("bam")
-        except metadata.PackageNotFoundError:
-            pass
-        self.title = f"BAM - Bioimage Analysis Manager {version}"
+        self.title = f"BAM - Bioimage Analysis Manager {_BAM_VERSION}"
 
     def _init_row_data(self) -> None:
         self._init_collaborator_rows()
@@ -333,160 +520,60 @@ class BAApp(
         collaborators = self._defaults.get("collaborators")
         if not isinstance(collaborators, list):
             return
-        self._collaborator_rows = [
-            {
-                "name": str(item.get("name", "")) if isinstance(item, dict) else "",
-                "role": str(item.get("role", "")) if isinstance(item, dict) else "",
-                "email": str(item.get("email", "")) if isinstance(item, dict) else "",
-                "affiliation": str(item.get("affiliation", ""))
-                if isinstance(item, dict)
-                else "",
-            }
-            for item in collaborators
-        ]
+        self._collaborator_rows = _normalize_rows(collaborators, _COLLABORATOR_FIELDS)
 
     def _init_dataset_rows(self) -> None:
         datasets = self._defaults.get("datasets")
         if not isinstance(datasets, list):
             return
-        self._dataset_rows = [
-            {
-                "name": str(item.get("name", "")) if isinstance(item, dict) else "",
-                "endpoint": str(item.get("endpoint", ""))
-                if isinstance(item, dict)
-                else "",
-                "source": str(item.get("source", "")) if isinstance(item, dict) else "",
-                "local": str(item.get("local", "")) if isinstance(item, dict) else "",
-                "locally_mounted": bool(item.get("locally_mounted", False))
-                if isinstance(item, dict)
-                else False,
-                "description": str(item.get("description", ""))
-                if isinstance(item, dict)
-                else "",
-                "format": str(item.get("format", "")) if isinstance(item, dict) else "",
-                "image_quality": str(item.get("image_quality", ""))
-                if isinstance(item, dict)
-                else "",
-                "raw_size_gb": str(item.get("raw_size_gb", ""))
-                if isinstance(item, dict)
-                else "",
-                "raw_size_unit": str(item.get("raw_size_unit", "gb"))
-                if isinstance(item, dict)
-                else "gb",
-                "compressed": bool(item.get("compressed", False))
-                if isinstance(item, dict)
-                else False,
-                "uncompressed_size_gb": str(item.get("uncompressed_size_gb", ""))
-                if isinstance(item, dict)
-                else "",
-                "uncompressed_size_unit": str(item.get("uncompressed_size_unit", "gb"))
-                if isinstance(item, dict)
-                else "gb",
-            }
-            for item in datasets
-        ]
+        self._dataset_rows = _normalize_rows(datasets, _DATASET_FIELDS)
 
     def _init_acquisition_rows(self) -> None:
         acquisition_sessions = self._defaults.get("acquisition_sessions")
         if not isinstance(acquisition_sessions, list):
             return
-        self._acquisition_rows = [
-            {
-                "imaging_date": item.get("imaging_date")
-                if isinstance(item, dict)
-                else None,
-                "microscope": str(item.get("microscope", ""))
-                if isinstance(item, dict)
-                else "",
-                "modality": str(item.get("modality", ""))
-                if isinstance(item, dict)
-                else "",
-                "objective": str(item.get("objective", ""))
-                if isinstance(item, dict)
-                else "",
-                "voxel_x": str(item.get("voxel_x", ""))
-                if isinstance(item, dict)
-                else "",
-                "voxel_y": str(item.get("voxel_y", ""))
-                if isinstance(item, dict)
-                else "",
-                "voxel_z": str(item.get("voxel_z", ""))
-                if isinstance(item, dict)
-                else "",
-                "time_interval_s": str(item.get("time_interval_s", ""))
-                if isinstance(item, dict)
-                else "",
-                "notes": str(item.get("notes", "")) if isinstance(item, dict) else "",
-                "channels": item.get("channels", []) if isinstance(item, dict) else [],
-            }
-            for item in acquisition_sessions
-        ]
+        rows = []
+        for item in acquisition_sessions:
+            # Non-dict entries become blank rows
+            get = item.get if isinstance(item, dict) else {}.get
+            rows.append(
+                {
+                    "imaging_date": get("imaging_date"),
+                    **{key: str(get(key, "")) for key in _ACQUISITION_TEXT_FIELDS},
+                    "channels": get("channels", []),
+                }
+            )
+        self._acquisition_rows = rows
 
     def _init_milestone_rows(self) -> None:
         milestones = self._defaults.get("milestones")
         if not isinstance(milestones, list):
             return
-        self._milestone_rows = [
-            {
-                "name": str(item.get("name", "")) if isinstance(item, dict) else "",
-                "target_date": item.get("target_date")
-                if isinstance(item, dict)
-                else None,
-                "actual_date": item.get("actual_date")
-                if isinstance(item, dict)
-                else None,
-                "status": str(item.get("status", "pending"))
-                if isinstance(item, dict)
-                else "pending",
-                "notes": str(item.get("notes", "")) if isinstance(item, dict) else "",
-            }
-            for item in milestones
-        ]
+        rows = []
+        for item in milestones:
+            get = item.get if isinstance(item, dict) else {}.get
+            rows.append(
+                {
+                    "name": str(get("name", "")),
+                    "target_date": get("target_date"),
+                    "actual_date": get("actual_date"),
+                    "status": str(get("status", "pending")),
+                    "notes": str(get("notes", "")),
+                }
+            )
+        self._milestone_rows = rows
 
     def _init_hardware_rows(self) -> None:
         hardware_profiles = self._defaults.get("hardware_profiles")
         if not isinstance(hardware_profiles, list):
             return
-        self._hardware_profiles = [
-            {
-                "name": str(item.get("name", "")) if isinstance(item, dict) else "",
-                "cpu": str(item.get("cpu", "")) if isinstance(item, dict) else "",
-                "cores": str(item.get("cores", "")) if isinstance(item, dict) else "",
-                "ram": str(item.get("ram", "")) if isinstance(item, dict) else "",
-                "gpu": str(item.get("gpu", "")) if isinstance(item, dict) else "",
-                "notes": str(item.get("notes", "")) if isinstance(item, dict) else "",
-                "is_cluster": bool(item.get("is_cluster", False))
-                if isinstance(item, dict)
-                else False,
-                "partition": str(item.get("partition", ""))
-                if isinstance(item, dict)
-                else "",
-                "node_type": str(item.get("node_type", ""))
-                if isinstance(item, dict)
-                else "",
-            }
-            for item in hardware_profiles
-        ]
+        self._hardware_profiles = _normalize_rows(hardware_profiles, _HARDWARE_FIELDS)
 
     def _init_channel_rows(self) -> None:
         channels = self._defaults.get("channels")
         if not isinstance(channels, list):
             return
-        self._channel_rows = [
-            {
-                "name": str(item.get("name", "")) if isinstance(item, dict) else "",
-                "fluorophore": str(item.get("fluorophore", ""))
-                if isinstance(item, dict)
-                else "",
-                "excitation_nm": str(item.get("excitation_nm", ""))
-                if isinstance(item, dict)
-                else "",
-                "emission_nm": str(item.get("emission_nm", ""))
-                if isinstance(item, dict)
-                else "",
-            }
-            for item in channels
-        ]
+        self._channel_rows = _normalize_rows(channels, _CHANNEL_FIELDS)
 
     def compose(self) -> ComposeResult:
         yield Header()
@@ -501,13 +588,13 @@ class BAApp(
         yield Footer()
 
     def on_mount(self) -> None:
-        tabbed = self.query_one("#tabs", TabbedContent)
+        tabbed = self._tabs = self.query_one("#tabs", TabbedContent)
         if self._mode in ("log", "idea", "outputs", "hub"):
             tabbed.active = self._mode
         elif self._mode == "artifact":
-            tabbed.active = "outputs"
+            tabbed.active = _TAB_OUTPUTS
         else:
-            tabbed.active = "setup"
+            tabbed.active = _TAB_SETUP
             # Only restore saved UI state for menu mode
             if self._mode == "menu":
                 self._apply_ui_state()
@@ -518,8 +605,6 @@ class BAApp(
         self._init_worklog()
 
         # Migrate from old CSV if needed
-        from .worklog import migrate_csv_to_yaml, init_worklog_manifest_section
-
         migrated = migrate_csv_to_yaml(self._project_root)
         if migrated:
             self.notify(
@@ -534,110 +619,102 @@ class BAApp(
         self._load_worklog_data()
 
         self._load_manifest_sections()
-        self.set_interval(1, self._tick_worklog)
-        self.set_interval(1, self._poll_method_preview)
+        self.set_interval(1, self._tick)
 
-        try:
-            task_type_select = self.query_one("#task_type", Select)
-            if task_type_select.value is None and task_type_select.options:
-                task_type_select.value = task_type_select.options[0][1]
-        except Exception:
-            pass
-
-        try:
-            self._manifest_errors = self.query_one("#manifest_error", Static)
-        except Exception:
-            self._manifest_errors = None
-
-        try:
-            self._method_path_suggestions = self.query_one(
-                "#method_path_suggestions", OptionList
-            )
-        except Exception:
-            self._method_path_suggestions = None
-
-        try:
-            self._ensure_collaborator_rows()
-            self._populate_collaborators_table()
-        except Exception:
-            pass
-
-        try:
-            self._populate_channels_table()
-        except Exception:
-            pass
+        # Post-compose setup: fill tables and sync widgets in one render pass
+        with self.batch_update():
+            try:
+                task_type_select = self.query_one("#task_type", Select)
+                if task_type_select.value is None and task_type_select.options:
+                    task_type_select.value = task_type_select.options[0][1]
+            except Exception:
+                pass
 
-        try:
-            self._populate_acquisition_table()
-        except Exception:
-            pass
+            try:
+                self._manifest_errors = self.query_one("#manifest_error", Static)
+            except Exception:
+                self._manifest_errors = None
 
-        try:
-            self._ensure_dataset_rows()
-        except Exception:
-            pass
+            try:
+                self._method_path_suggestions = self.query_one(
+                    "#method_path_suggestions", OptionList
+                )
+                self._method_path_input = self.query_one("#method_path", Input)
+                self._method_preview_markdown = self.query_one(
+                    "#method_preview", Markdown
+                )
+            except Exception:
+                self._method_path_suggestions = None
 
-        try:
-            self._populate_datasets_table()
-        except Exception:
-            pass
+            # Widgets touched on every archive keystroke / endpoint change
+            try:
+                self._archive_path_suggestions = self.query_one(
+                    "#archive_location_suggestions", OptionList
+                )
+                self._archive_locally_mounted = self.query_one(
+                    "#archive_locally_mounted", Checkbox
+                )
+            except Exception:
+                self._archive_path_suggestions = None
+
+            for fill in (
+                self._ensure_collaborator_rows,
+                self._populate_collaborators_table,
+                self._populate_channels_table,
+                self._populate_acquisition_table,
+                self._ensure_dataset_rows,
+                self._populate_datasets_table,
+                self._populate_milestones_table,
+                self._populate_figure_tree,
+                self._populate_artifacts_table,
+                self._populate_hardware_table,
+            ):
+                try:
+                    fill()
+                except Exception:
+                    pass
 
-        try:
-            self._populate_milestones_table()
-        except Exception:
-            pass
+            if self._mode == "artifact":
+                try:
+                    outputs_sections = self.query_one(
+                        "#outputs_sections", TabbedContent
+                    )
+                    outputs_sections.active = "outputs_artifacts"
+                except Exception:
+                    pass
 
-        try:
-            self._populate_figure_tree()
-        except Exception:
-            pass
+            # Set initial visibility of data sections
+            self._toggle_data_sections(bool(self._defaults.get("data_enabled", True)))
 
-        try:
-            self._populate_artifacts_table()
-        except Exception:
-            pass
+            # Notify if existing manifest was loaded
+            if self._defaults.get("project_name"):
+                self.notify("Manifest loaded", severity="information")
 
-        if self._mode == "artifact":
             try:
-                outputs_sections = self.query_one("#outputs_sections", TabbedContent)
-                outputs_sections.active = "outputs_artifacts"
+                git_remote_input = self.query_one("#git_remote", Input)
+                if not git_remote_input.value.strip():
+                    git_remote_input.value = detect_git_remote(self._project_root)
             except Exception:
                 pass
 
-        try:
-            self._populate_hardware_table()
-        except Exception:
-            pass
-
-        try:
-            self._populate_milestones_table()
-        except Exception:
-            pass
-
-        # Set initial visibility of data sections
-        self._toggle_data_sections(bool(self._defaults.get("data_enabled", True)))
+    def _tick(self) -> None:
+        """Single 1 Hz timer: worklog clock every tick, method preview every other.
 
-        try:
-            self._ensure_collaborator_rows()
-        except Exception:
-            pass
-
-        # Notify if existing manifest was loaded
-        if self._defaults.get("project_name"):
-            self.notify("Manifest loaded", severity="information")
-
-        try:
-            git_remote_input = self.query_one("#git_remote", Input)
-            if not git_remote_input.value.strip():
-                git_remote_input.value = detect_git_remote(self._project_root)
-        except Exception:
-            pass
-
-    def on_shutdown(self) -> None:
-        self._store_ui_state()
+        The method preview is only polled when no file watcher is running.
+        """
+        self._tick_worklog()
+        self._tick_count += 1
+        if (
+            self._method_preview_visible
+            and not self._method_preview_watched
+            and not self._tick_count % 2
+        ):
+            self._poll_method_preview()
 
     def on_unmount(self) -> None:
-        self._store_ui_state()
+        # The screen stack is already gone here, so _store_ui_state would
+        # return early; exit paths store the UI state before exit() instead
+        self._method_preview_watcher.stop()
 
     def on_button_pressed(self, event: Button.Pressed) -> None:
         button_id = event.button.id
@@ -711,16 +788,21 @@ class BAApp(
         if event.input.id == "message":
             self._submit_log()
         elif event.input.id in ("project_name", "analyst"):
-            self._refresh_init_validation()
+            self._schedule_validation()
         elif event.input.id == "method_path":
             self._hide_method_path_suggestions()
             self._load_method_preview()
             self._maybe_sync_method_path()
 
-    def on_input_changed(self, event: Input.Changed) -> None:
-        if event.input.id in ("project_name", "analyst"):
-            self._refresh_init_validation()
+    @on(Input.Changed, "#project_name")
+    def _on_project_name_changed(self, event: Input.Changed) -> None:
+        self.project_name_valid = bool(event.value.strip())
+
+    @on(Input.Changed, "#analyst")
+    def _on_analyst_changed(self, event: Input.Changed) -> None:
+        self.analyst_valid = bool(event.value.strip())
 
+    def on_input_changed(self, event: Input.Changed) -> None:
         if event.input.id == "method_path":
             try:
                 focused = self.focused
@@ -730,11 +812,13 @@ class BAApp(
                     self._hide_method_path_suggestions()
             except Exception:
                 pass
-            self._load_method_preview_if_exists(event.value)
+            self._schedule_method_preview(event.value)
         elif event.input.id == "archive_location":
             try:
                 focused = self.focused
-                locally_mounted = self.query_one("#archive_locally_mounted", Checkbox)
+                locally_mounted = self._archive_locally_mounted or self.query_one(
+                    "#archive_locally_mounted", Checkbox
+                )
                 if not locally_mounted.value:
                     self._hide_archive_path_suggestions()
                     return
@@ -754,7 +838,9 @@ class BAApp(
                 pass
         elif input_id == "archive_location":
             try:
-                locally_mounted = self.query_one("#archive_locally_mounted", Checkbox)
+                locally_mounted = self._archive_locally_mounted or self.query_one(
+                    "#archive_locally_mounted", Checkbox
+                )
                 if locally_mounted.value:
                     self._update_archive_path_suggestions(event.input.value)
             except Exception:
@@ -768,7 +854,7 @@ class BAApp(
             self._hide_archive_path_suggestions()
 
     def _handle_fig_add_root(self) -> None:
-        self.push_screen(FigureNodeModal(), self._handle_new_figure_root)
+        self.push_screen(screens.FigureNodeModal(), self._handle_new_figure_root)
 
     def _handle_fig_add_child(self) -> None:
         _, payload = self._get_selected_tree_payload()
@@ -776,7 +862,7 @@ class BAApp(
             self.notify("Select a figure or panel", severity="warning")
             return
         self.push_screen(
-            FigureNodeModal(),
+            screens.FigureNodeModal(),
             lambda data: self._handle_new_figure_child(payload, data),
         )
 
@@ -786,7 +872,7 @@ class BAApp(
             self.notify("Select a figure or panel", severity="warning")
             return
         self.push_screen(
-            FigureElementModal(),
+            screens.FigureElementModal(),
             lambda data: self._handle_new_figure_element(payload, data),
         )
 
@@ -797,12 +883,12 @@ class BAApp(
             return
         if payload.get("type") == "element":
             self.push_screen(
-                FigureElementModal(payload),
+                screens.FigureElementModal(payload),
                 lambda data: self._handle_edit_figure(payload, data),
             )
         else:
             self.push_screen(
-                FigureNodeModal(payload),
+                screens.FigureNodeModal(payload),
                 lambda data: self._handle_edit_figure(payload, data),
             )
 
@@ -813,7 +899,7 @@ class BAApp(
             return
         label = payload.get("id", "item")
         self.push_screen(
-            DeleteConfirmModal(str(label)),
+            screens.DeleteConfirmModal(str(label)),
             lambda result: self._handle_delete_figure(payload, result),
         )
 
@@ -1207,16 +1293,35 @@ class BAApp(
             table = self.query_one("#artifacts_table", DataTable)
         except Exception:
             return
-        table.clear(columns=True)
-        table.add_columns("Path", "Type", "Status", "Description")
-        for idx, row in enumerate(self._artifact_rows):
-            table.add_row(
-                str(row.get("path", "")),
-                str(row.get("type", "")),
-                str(row.get("status", "")),
-                self._truncate_text(str(row.get("description", "")), 40),
-                key=str(idx),
-            )
+        sync_table_rows(
+            table,
+            [self._artifact_cells(row) for row in self._artifact_rows],
+            ("Path", "Type", "Status", "Description"),
+        )
+
+    def _artifact_cells(self, row: dict[str, object]) -> tuple[str, ...]:
+        return (
+            str(row.get("path", "")),
+            str(row.get("type", "")),
+            str(row.get("status", "")),
+            self._truncate_text(str(row.get("description", "")), 40),
+        )
+
+    def _refresh_artifact_row(self, idx: int) -> None:
+        """Redraw only row ``idx`` after it was appended or edited."""
+        try:
+            table = self.query_one("#artifacts_table", DataTable)
+        except Exception:
+            return
+        cells = self._artifact_cells(self._artifact_rows[idx])
+        if table.row_count == len(self._artifact_rows):
+            update_table_row(table, idx, cells)
+        elif table.row_count == idx == len(self._artifact_rows) - 1:
+            # Same key scheme as sync_table_rows: the table assigns the key
+            # and selection handlers look the row up with get_row_index
+            table.add_rows([cells])
+        else:
+            self._populate_artifacts_table()
 
     def _truncate_text(self, value: str, max_len: int = 40) -> str:
         if len(value) <= max_len:
@@ -1234,7 +1339,7 @@ class BAApp(
         except Exception:
             initial_data = None
         self.push_screen(
-            ArtifactModal(load_endpoint_options(), initial_data),
+            screens.ArtifactModal(load_endpoint_options(), initial_data),
             self._handle_new_artifact,
         )
 
@@ -1262,7 +1367,7 @@ class BAApp(
         if not data:
             return
         self._artifact_rows.append(data)
-        self._populate_artifacts_table()
+        self._refresh_artifact_row(len(self._artifact_rows) - 1)
 
     def _handle_edit_artifact(self, idx: int, data: dict[str, object] | None) -> None:
         if data and data.get("__delete__"):
@@ -1272,71 +1377,55 @@ class BAApp(
             return
         if data and 0 <= idx < len(self._artifact_rows):
             self._artifact_rows[idx] = data
-            self._populate_artifacts_table()
+            self._refresh_artifact_row(idx)
 
     def _handle_artifact_row_selected(self, idx: int) -> None:
         if not (0 <= idx < len(self._artifact_rows)):
             return
         row_data = self._artifact_rows[idx]
         self.push_screen(
-            ArtifactModal(load_endpoint_options(), row_data, allow_remove=True),
+            screens.ArtifactModal(load_endpoint_options(), row_data, allow_remove=True),
             lambda data, i=idx: self._handle_edit_artifact(i, data),
         )
 
     def _collect_archive(self) -> dict[str, object]:
+        widgets = self._form_widgets()
         data: dict[str, object] = {}
-        status = self.query_one("#archive_status", Select).value
+        status = widgets["archive_status"].value
         if status and status != Select.BLANK:
             data["status"] = str(status)
-        date_value = self.query_one("#archive_date", DateSelect).value
+        date_value = widgets["archive_date"].value
         if date_value:
             # Normalize to date only (remove time portion)
             if hasattr(date_value, "date"):
                 data["archive_date"] = date_value.date()
             else:
                 data["archive_date"] = date_value
-        endpoint_value = self.query_one("#archive_endpoint", Select).value
-        endpoint_custom = self.query_one(
-            "#archive_endpoint_custom", Input
-        ).value.strip()
-        endpoint = ""
-        if endpoint_value and endpoint_value != Select.BLANK:
-            endpoint = str(endpoint_value)
-        if endpoint.lower() == "other" and endpoint_custom:
-            endpoint = endpoint_custom
-        elif not endpoint and endpoint_custom:
-            endpoint = endpoint_custom
+        endpoint = select_or_custom(
+            widgets["archive_endpoint"], widgets["archive_endpoint_custom"]
+        )
         if endpoint:
             data["endpoint"] = endpoint
-        data["archive_location"] = self.query_one(
-            "#archive_location", Input
-        ).value.strip()
-        retention = self.query_one("#retention_years", Input).value.strip()
+        data["archive_location"] = widgets["archive_location"].value.strip()
+        retention = widgets["retention_years"].value.strip()
         if retention:
             try:
                 data["retention_years"] = int(retention)
             except ValueError:
                 pass
-        data["backup_verified"] = bool(
-            self.query_one("#backup_verified", Checkbox).value
-        )
-        data["notes"] = self.query_one("#archive_notes", TextArea).text.strip()
+        data["backup_verified"] = bool(widgets["backup_verified"].value)
+        data["notes"] = widgets["archive_notes"].text.strip()
         return data
 
     def _collect_publication(self) -> dict[str, object]:
+        widgets = self._form_widgets()
         data: dict[str, object] = {}
-        status = self.query_one("#pub_status", Select).value
+        status = widgets["pub_status"].value
         if status and status != Select.BLANK:
             data["status"] = str(status)
-        data["target_journal"] = self.query_one("#target_journal", Input).value.strip()
-        data["manuscript_path"] = self.query_one(
-            "#manuscript_path", Input
-        ).value.strip()
-        data["preprint_doi"] = self.query_one("#preprint_doi", Input).value.strip()
-        data["published_doi"] = self.query_one("#published_doi", Input).value.strip()
-        data["github_repo"] = self.query_one("#github_repo", Input).value.strip()
-        data["zenodo_doi"] = self.query_one("#zenodo_doi", Input).value.strip()
-        data["notes"] = self.query_one("#pub_notes", TextArea).text.strip()
+        for field in _PUBLICATION_INPUTS:
+            data[field] = widgets[field].value.strip()
+        data["notes"] = widgets["pub_notes"].text.strip()
         if self._figure_tree_data:
             data["figures"] = self._figure_tree_data
         return data
@@ -1383,43 +1472,26 @@ class BAApp(
             self._hide_archive_path_suggestions()
 
     def _update_archive_path_suggestions(self, current_value: str) -> None:
+        if not current_value:
+            self._hide_archive_path_suggestions()
+            return
+        self.run_worker(
+            self._fill_archive_path_suggestions(current_value),
+            exclusive=True,
+            group="archive_path_suggestions",
+        )
+
+    async def _fill_archive_path_suggestions(self, current_value: str) -> None:
         try:
-            suggestions = self.query_one("#archive_location_suggestions", OptionList)
+            entries = await suggest_paths_async(current_value)
+            suggestions = self._archive_path_suggestions or self.query_one(
+                "#archive_location_suggestions", OptionList
+            )
             suggestions.clear_options()
-            if not current_value:
-                suggestions.remove_class("visible")
-                self._archive_path_suggestions_visible = False
-                return
-            path = Path(current_value).expanduser()
-            if path.is_dir():
-                search_dir = path
-                prefix = ""
-            else:
-                search_dir = path.parent
-                prefix = path.name.lower()
-            if not search_dir.exists():
-                suggestions.remove_class("visible")
-                self._archive_path_suggestions_visible = False
-                return
-            entries: list[tuple[str, str]] = []
-            try:
-                # Collect both directories and files
-                for entry in sorted(search_dir.iterdir()):
-                    name = entry.name
-                    if not prefix or name.lower().startswith(prefix):
-                        if entry.is_dir():
-                            entries.append((str(entry), f"📁 {name}/"))
-                        else:
-                            entries.append((str(entry), f"📄 {name}"))
-                        if len(entries) >= 20:
-                            break
-            except PermissionError:
-                pass
             if entries:
-                from textual.widgets.option_list import Option
-
-                for entry_path, display_name in entries:
-                    suggestions.add_option(Option(display_name, id=entry_path))
+                suggestions.add_options(
+                    [Option(name, id=entry_path) for entry_path, name in entries]
+                )
                 suggestions.add_class("visible")
                 self._archive_path_suggestions_visible = True
             else:
@@ -1429,8 +1501,11 @@ class BAApp(
             self._archive_path_suggestions_visible = False
 
     def _hide_archive_path_suggestions(self) -> None:
+        self.workers.cancel_group(self, "archive_path_suggestions")
         try:
-            suggestions = self.query_one("#archive_location_suggestions", OptionList)
+            suggestions = self._archive_path_suggestions or self.query_one(
+                "#archive_location_suggestions", OptionList
+            )
             suggestions.remove_class("visible")
             suggestions.clear_options()
             self._archive_path_suggestions_visible = False
@@ -1438,37 +1513,23 @@ class BAApp(
             pass
 
     def on_select_changed(self, event: Select.Changed) -> None:
-        if event.select.id == "collab_role_select":
-            pass
-        elif event.select.id == "modality":
+        select_id = event.select.id
+        row_id = self._OTHER_ROWS.get(select_id or "")
+        if row_id:
             try:
-                row = self.query_one("#modality_other_row", Horizontal)
-                if event.value and str(event.value).lower() == "other":
-                    row.remove_class("hidden")
-                else:
-                    row.add_class("hidden")
-            except Exception:
-                pass
-        elif event.select.id == "environment":
-            try:
-                row = self.query_one("#environment_other_row", Horizontal)
-                if event.value and str(event.value).lower() == "other":
-                    row.remove_class("hidden")
-                else:
-                    row.add_class("hidden")
-            except Exception:
-                pass
-        elif event.select.id == "archive_endpoint":
-            try:
-                row = self.query_one("#archive_endpoint_custom_row", Horizontal)
-                if event.value and str(event.value).lower() == "other":
-                    row.remove_class("hidden")
-                else:
-                    row.add_class("hidden")
+                row = self._other_row_cache.get(row_id)
+                if row is None:
+                    row = self.query_one(f"#{row_id}", Horizontal)
+                    self._other_row_cache[row_id] = row
+                is_other = bool(event.value) and str(event.value).lower() == "other"
+                row.set_class(not is_other, "hidden")
             except Exception:
                 pass
+        if select_id == "archive_endpoint":
             try:
-                checkbox = self.query_one("#archive_locally_mounted", Checkbox)
+                checkbox = self._archive_locally_mounted or self.query_one(
+                    "#archive_locally_mounted", Checkbox
+                )
                 is_local = event.value and str(event.value).lower() == "local"
                 if is_local:
                     checkbox.value = True
@@ -1492,18 +1553,19 @@ class BAApp(
 
     def on_data_table_row_selected(self, event: DataTable.RowSelected) -> None:
         """Handle row selection in tables - double-click opens edit modal."""
-        import time
-
-        row_key = event.row_key.value
-        if row_key is None:
-            return
         table_id = event.data_table.id
         if not table_id:
             return
+        # Row keys are not positions (sync_table_rows lets the table assign
+        # them), so resolve the row's current index
+        try:
+            idx = event.data_table.get_row_index(event.row_key)
+        except RowDoesNotExist:
+            return
 
         # Detect double-click (within 500ms)
         current_time = time.time()
-        click_key = (table_id, row_key)
+        click_key = (table_id, idx)
 
         if (
             self._last_click_row == click_key
@@ -1521,11 +1583,7 @@ class BAApp(
             }
             handler = handlers.get(table_id)
             if handler:
-                try:
-                    idx = int(row_key)
-                    handler(idx)
-                except (ValueError, TypeError):
-                    pass
+                handler(idx)
             # Reset after double-click
             self._last_click_time = 0.0
             self._last_click_row = None
@@ -1537,12 +1595,9 @@ class BAApp(
     def on_data_table_row_highlighted(self, event: DataTable.RowHighlighted) -> None:
         if event.data_table.id != "acquisition_table":
             return
-        row_key = event.row_key.value
-        if row_key is None:
-            return
         try:
-            idx = int(row_key)
-        except (ValueError, TypeError):
+            idx = event.data_table.get_row_index(event.row_key)
+        except RowDoesNotExist:
             return
         if not (0 <= idx < len(self._acquisition_rows)):
             return
@@ -1558,7 +1613,7 @@ class BAApp(
             return
         row_data = self._collaborator_rows[idx]
         self.push_screen(
-            CollaboratorModal(load_role_options(), row_data, allow_remove=True),
+            screens.CollaboratorModal(load_role_options(), row_data, allow_remove=True),
             lambda data, i=idx: self._handle_edit_collaborator(i, data),
         )
 
@@ -1567,7 +1622,7 @@ class BAApp(
             return
         row_data = self._channel_rows[idx]
         self.push_screen(
-            ChannelModal(row_data, allow_remove=True),
+            screens.ChannelModal(row_data, allow_remove=True),
             lambda data, i=idx: self._handle_edit_channel(i, data),
         )
 
@@ -1577,7 +1632,7 @@ class BAApp(
         self._selected_hardware_index = idx
         row_data = self._hardware_profiles[idx]
         self.push_screen(
-            HardwareModal(row_data, allow_remove=True),
+            screens.HardwareModal(row_data, allow_remove=True),
             lambda data, i=idx: self._handle_edit_hardware(i, data),
         )
 
@@ -1586,7 +1641,7 @@ class BAApp(
             return
         row_data = self._dataset_rows[idx]
         self.push_screen(
-            DatasetModal(
+            screens.DatasetModal(
                 load_endpoint_options(),
                 load_dataset_format_options(),
                 row_data,
@@ -1600,7 +1655,7 @@ class BAApp(
             return
         row_data = self._milestone_rows[idx]
         self.push_screen(
-            MilestoneModal(row_data, allow_remove=True),
+            screens.MilestoneModal(row_data, allow_remove=True),
             lambda data, i=idx: self._handle_edit_milestone(i, data),
         )
 
@@ -1614,7 +1669,7 @@ class BAApp(
             self._store_channels_for_session(self._selected_acquisition_index)
         row_data = self._acquisition_rows[idx]
         self.push_screen(
-            AcquisitionSessionModal(row_data, allow_remove=True),
+            screens.AcquisitionSessionModal(row_data, allow_remove=True),
             lambda data, i=idx: self._handle_edit_acquisition(i, data),
         )
         self._load_session_channels(idx)
@@ -1622,7 +1677,7 @@ class BAApp(
     def _add_list_entries(self, list_id: str, title: str) -> None:
         """Open modal to add comma-separated entries."""
         self.push_screen(
-            CustomInputModal(title, placeholder="Comma-separated"),
+            screens.CustomInputModal(title, placeholder="Comma-separated"),
             lambda items, lid=list_id: self._handle_list_entries(lid, items),
         )
 
@@ -1631,14 +1686,13 @@ class BAApp(
             return
         try:
             selection_list = self.query_one(f"#{list_id}", SelectionList)
-            existing = {str(opt.id) for opt in selection_list._options}
-            for item in items:
-                if item not in existing:
-                    selection_list.add_option(Selection(item, item, True))
-                selection_list.select(item)
+            select_values(selection_list, items, add_missing=True)
         except Exception:
             pass
 
+    def _move_input_cursor(self, input_widget: Input, position: int) -> None:
+        input_widget.cursor_position = position
+
     def on_option_list_option_selected(self, event: OptionList.OptionSelected) -> None:
         if event.option_list.id == "method_path_suggestions":
             if self._active_method_input:
@@ -1646,56 +1700,41 @@ class BAApp(
                     input_widget = self.query_one(
                         f"#{self._active_method_input}", Input
                     )
-                    # Use the option id which contains the full path
-                    selected = (
-                        str(event.option.id)
-                        if event.option.id
-                        else str(event.option.prompt)
-                    )
+                    # Suggestions are added with the full path as option id
+                    selected = event.option.id
+                    if not selected:
+                        return
                     input_widget.value = selected
                     self._hide_method_path_suggestions()
                     input_widget.focus()
 
-                    def _move_cursor() -> None:
-                        try:
-                            input_widget.cursor_position = len(selected)
-                        except Exception:
-                            pass
-
-                    try:
-                        self.call_later(_move_cursor)
-                    except Exception:
-                        _move_cursor()
+                    self.call_after_refresh(
+                        self._move_input_cursor, input_widget, len(selected)
+                    )
                     self._load_method_preview()
                 except Exception:
                     pass
         elif event.option_list.id == "archive_location_suggestions":
             try:
                 input_widget = self.query_one("#archive_location", Input)
-                # Use the option id which contains the full path
-                selected = (
-                    str(event.option.id)
-                    if event.option.id
-                    else str(event.option.prompt)
-                )
+                # Suggestions are added with the full path as option id
+                selected = event.option.id
+                if not selected:
+                    return
                 input_widget.value = selected
                 self._hide_archive_path_suggestions()
                 input_widget.focus()
 
-                def _move_cursor() -> None:
-                    try:
-                        input_widget.cursor_position = len(selected)
-                    except Exception:
-                        pass
-
-                try:
-                    self.call_later(_move_cursor)
-                except Exception:
-                    _move_cursor()
+                self.call_after_refresh(
+                    self._move_input_cursor, input_widget, len(selected)
+                )
             except Exception:
                 pass
 
     def on_key(self, event) -> None:
+        if event.key not in self._ACTIONABLE_KEYS:
+            return
+
         # Don't handle context shortcuts if a modal screen is active
         if self.screen_stack and len(self.screen_stack) > 1:
             # Modal is open, let it handle the keys
@@ -1704,8 +1743,8 @@ class BAApp(
         if event.key in ("a", "p", "e", "r", "d", "enter"):
             try:
                 if isinstance(self.focused, Tree):
-                    tabbed = self.query_one("#tabs", TabbedContent)
-                    if tabbed.active == "outputs":
+                    tabbed = self._main_tabs()
+                    if tabbed.active == _TAB_OUTPUTS:
                         outputs_sections = self.query_one(
                             "#outputs_sections", TabbedContent
                         )
@@ -1730,8 +1769,8 @@ class BAApp(
             try:
                 if isinstance(self.focused, Input):
                     return
-                tabbed = self.query_one("#tabs", TabbedContent)
-                if tabbed.active == "setup":
+                tabbed = self._main_tabs()
+                if tabbed.active == _TAB_SETUP:
                     setup_sections = self.query_one("#setup_sections", TabbedContent)
                     if setup_sections.active == "setup_data":
                         self.action_sync_dataset()
@@ -1742,182 +1781,91 @@ class BAApp(
                 pass
 
         if event.key in ("a", "d", "enter"):
-            try:
-                is_add = event.key == "a"
-                is_remove = event.key == "d"
-                is_edit = event.key == "enter"
-                tabbed = self.query_one("#tabs", TabbedContent)
-                # Handle collaborators table in setup tab
-                if tabbed.active == "setup":
-                    table = self.query_one("#datasets_table", DataTable)
-                    if table.has_focus:
-                        if is_add:
-                            self.action_add_dataset()
-                        elif is_remove:
-                            self.action_remove_dataset()
-                        elif is_edit and table.cursor_row is not None:
-                            self._handle_dataset_row_selected(table.cursor_row)
-                        event.prevent_default()
-                        event.stop()
-                        return
-                    table = self.query_one("#collaborators_table", DataTable)
-                    if table.has_focus:
-                        if is_add:
-                            self.action_add_collaborator_row()
-                        elif is_remove:
-                            self.action_remove_collaborator_row()
-                        elif is_edit and table.cursor_row is not None:
-                            self._handle_collaborator_row_selected(table.cursor_row)
-                        event.prevent_default()
-                        event.stop()
-                        return
-                # Handle channels table in science tab
-                elif tabbed.active == "science":
-                    science_sections = self.query_one(
-                        "#science_sections", TabbedContent
-                    )
-                    if science_sections.active == "science_acquisition":
-                        table = self.query_one("#acquisition_table", DataTable)
-                        if table.has_focus:
-                            if is_add:
-                                self.action_add_acquisition()
-                            elif is_remove:
-                                self.action_remove_acquisition()
-                            elif is_edit and table.cursor_row is not None:
-                                self._handle_acquisition_row_selected(table.cursor_row)
-                            event.prevent_default()
-                            event.stop()
-                            return
-                    table = self.query_one("#channels_table", DataTable)
-                    if table.has_focus:
-                        if is_add:
-                            self.action_add_channel_row()
-                        elif is_remove:
-                            self.action_remove_channel_row()
-                        elif is_edit and table.cursor_row is not None:
-                            self._handle_channel_row_selected(table.cursor_row)
-                        event.prevent_default()
-                        event.stop()
-                        return
-                    hardware_table = self.query_one("#hardware_table", DataTable)
-                    if hardware_table.has_focus:
-                        if is_add:
-                            self._add_hardware_profile()
-                        elif is_remove:
-                            self._remove_selected_hardware()
-                        elif is_edit and hardware_table.cursor_row is not None:
-                            self._handle_hardware_row_selected(
-                                hardware_table.cursor_row
-                            )
-                        event.prevent_default()
-                        event.stop()
-                        return
-                elif tabbed.active == "admin":
-                    admin_sections = self.query_one("#admin_sections", TabbedContent)
-                    if admin_sections.active == "admin_timeline":
-                        table = self.query_one("#milestones_table", DataTable)
-                        if table.has_focus:
-                            if is_add:
-                                self.action_add_milestone()
-                            elif is_remove:
-                                self.action_remove_milestone()
-                            elif is_edit and table.cursor_row is not None:
-                                self._handle_milestone_row_selected(table.cursor_row)
-                            event.prevent_default()
-                            event.stop()
-                            return
-                elif tabbed.active == "outputs":
-                    outputs_sections = self.query_one(
-                        "#outputs_sections", TabbedContent
-                    )
-                    if outputs_sections.active == "outputs_artifacts":
-                        table = self.query_one("#artifacts_table", DataTable)
-                        if table.has_focus:
-                            if is_add:
-                                self.action_add_artifact()
-                            elif is_remove:
-                                self.action_remove_artifact()
-                            elif is_edit and table.cursor_row is not None:
-                                self._handle_artifact_row_selected(table.cursor_row)
-                            event.prevent_default()
-                            event.stop()
-                            return
-            except Exception:
-                pass
+            focused = self.focused
+            if isinstance(focused, DataTable) and focused.id in _TABLE_KEY_ACTIONS:
+                add, remove, edit = _TABLE_KEY_ACTIONS[focused.id]
+                try:
+                    if event.key == "a":
+                        getattr(self, add)()
+                    elif event.key == "d":
+                        getattr(self, remove)()
+                    elif focused.cursor_row is not None:
+                        getattr(self, edit)(focused.cursor_row)
+                except Exception:
+                    pass
+                event.prevent_default()
+                event.stop()
+                return
 
         # Handle path suggestions keyboard navigation
-        # Handle method path suggestions
-        try:
-            if self._method_path_suggestions_visible:
-                suggestions = self._method_path_suggestions or self.query_one(
-                    "#method_path_suggestions", OptionList
-                )
-                if suggestions.has_class("visible"):
-                    if event.key == "escape":
-                        if self._active_method_input:
-                            input_widget = self.query_one(
-                                f"#{self._active_method_input}", Input
-                            )
-                            self._hide_method_path_suggestions()
-                            input_widget.focus()
-                            event.prevent_default()
-                            event.stop()
-                    elif event.key == "down" and self._active_method_input:
-                        focused = self.focused
-                        if focused and focused.id == self._active_method_input:
-                            suggestions.focus()
-                            if suggestions.option_count > 0:
-                                suggestions.highlighted = 0
-                            event.prevent_default()
-                            event.stop()
-                    elif event.key == "up":
-                        if self.focused == suggestions and suggestions.highlighted == 0:
-                            if self._active_method_input:
-                                input_widget = self.query_one(
-                                    f"#{self._active_method_input}", Input
-                                )
-                                input_widget.focus()
-                                event.prevent_default()
-                                event.stop()
-        except Exception:
-            pass
+        if self._method_path_suggestions_visible:
+            self._navigate_suggestions(
+                event,
+                self._method_path_suggestions,
+                "method_path_suggestions",
+                self._active_method_input,
+                self._hide_method_path_suggestions,
+            )
+        if self._archive_path_suggestions_visible:
+            self._navigate_suggestions(
+                event,
+                self._archive_path_suggestions,
+                "archive_location_suggestions",
+                "archive_location",
+                self._hide_archive_path_suggestions,
+            )
 
+    def _navigate_suggestions(
+        self,
+        event,
+        suggestions: Optional[OptionList],
+        list_id: str,
+        input_id: Optional[str],
+        hide: Callable[[], None],
+    ) -> None:
+        """Move focus between a path input and its visible suggestion list."""
+        if not input_id:
+            return
         try:
-            if self._archive_path_suggestions_visible:
-                suggestions = self.query_one(
-                    "#archive_location_suggestions", OptionList
-                )
-                if suggestions.has_class("visible"):
-                    if event.key == "escape":
-                        input_widget = self.query_one("#archive_location", Input)
-                        self._hide_archive_path_suggestions()
-                        input_widget.focus()
-                        event.prevent_default()
-                        event.stop()
-                    elif event.key == "down":
-                        focused = self.focused
-                        if focused and focused.id == "archive_location":
-                            suggestions.focus()
-                            if suggestions.option_count > 0:
-                                suggestions.highlighted = 0
-                            event.prevent_default()
-                            event.stop()
-                    elif event.key == "up":
-                        if self.focused == suggestions and suggestions.highlighted == 0:
-                            input_widget = self.query_one("#archive_location", Input)
-                            input_widget.focus()
-                            event.prevent_default()
-                            event.stop()
+            suggestions = suggestions or self.query_one(f"#{list_id}", OptionList)
+            if not suggestions.has_class("visible"):
+                return
+            if event.key == "escape":
+                input_widget = self.query_one(f"#{input_id}", Input)
+                hide()
+            elif event.key == "down":
+                focused = self.focused
+                if focused is None or focused.id != input_id:
+                    return
+                suggestions.focus()
+                if suggestions.option_count > 0:
+                    suggestions.highlighted = 0
+                event.prevent_default()
+                event.stop()
+                return
+            elif (
+                event.key == "up"
+                and self.focused is suggestions
+                and suggestions.highlighted == 0
+            ):
+                input_widget = self.query_one(f"#{input_id}", Input)
+            else:
+                return
+            input_widget.focus()
+            event.prevent_default()
+            event.stop()
         except Exception:
             pass
 
     def action_new_manifest(self) -> None:
         """Create a new blank manifest."""
-        self.push_screen(NewManifestConfirmScreen(), self._handle_new_manifest_confirm)
+        self.push_screen(
+            screens.NewManifestConfirmScreen(), self._handle_new_manifest_confirm
+        )
 
     def action_reset_manifest(self) -> None:
         """Show confirmation dialog before reloading manifest from disk."""
-        self.push_screen(ResetConfirmScreen(), self._handle_reset_confirm)
+        self.push_screen(screens.ResetConfirmScreen(), self._handle_reset_confirm)
 
     def _handle_reset_confirm(self, result: str | None) -> None:
         """Handle the confirmation result from ResetConfirmScreen."""
@@ -1926,8 +1874,6 @@ class BAApp(
 
     def _do_reset_manifest(self) -> None:
         """Reload manifest from disk, discarding unsaved changes."""
-        from .io import load_manifest
-
         manifest_path = self._project_root / "manifest.yaml"
         manifest = load_manifest(manifest_path)
         if manifest is None:
@@ -1953,8 +1899,8 @@ class BAApp(
                     {"name": "", "role": "", "email": "", "affiliation": ""}
                 ]
                 self._populate_collaborators_table()
-                self._set_tab("init")
-                self._refresh_init_validation()
+                self._set_tab(_TAB_INIT)
+                self._schedule_validation()
                 self.notify("New manifest - fill in the form", severity="information")
             except Exception as e:
                 self.notify(
@@ -1963,8 +1909,8 @@ class BAApp(
         # "cancel" does nothing, just closes the modal
 
     def action_submit(self) -> None:
-        tabbed = self.query_one("#tabs", TabbedContent)
-        if tabbed.active == "init":
+        tabbed = self._main_tabs()
+        if tabbed.active == _TAB_INIT:
             self._submit_init()
         else:
             self._submit_log()
@@ -1974,116 +1920,84 @@ class BAApp(
         if self._mode == "artifact":
             self._submit_artifact()
             return
-        tabbed = self.query_one("#tabs", TabbedContent)
-        if tabbed.active == "init":
+        tabbed = self._main_tabs()
+        if tabbed.active == _TAB_INIT:
             self._save_init()
-        elif tabbed.active == "log":
+        elif tabbed.active == _TAB_LOG:
             self._save_log()
-        elif tabbed.active == "idea":
+        elif tabbed.active == _TAB_IDEA:
             self._submit_idea()
-        elif tabbed.active == "manifest":
+        elif tabbed.active == _TAB_MANIFEST:
             self._save_manifest()
-        elif tabbed.active in ("setup", "science", "admin", "outputs", "hub"):
+        elif tabbed.active in _MANIFEST_EDIT_TABS:
             # For manifest editing tabs, save the manifest
             self._save_init()
         else:
             self.notify("Save not available for this tab", severity="warning")
 
     def action_exit_app(self) -> None:
-        self.push_screen(ExitConfirmScreen(), self._handle_exit_confirm)
+        self.push_screen(screens.ExitConfirmScreen(), self._handle_exit_confirm)
+
+    async def action_quit(self) -> None:
+        """Quit immediately (ctrl+q), keeping the UI state."""
+        self._store_ui_state()
+        self.exit()
 
     def action_prev_main_tab(self) -> None:
         """Navigate to previous main tab."""
         try:
-            tabbed = self.query_one("#tabs", TabbedContent)
-            tabs = ["setup", "science", "admin", "outputs", "hub", "log", "idea"]
-            current_idx = tabs.index(tabbed.active) if tabbed.active in tabs else 0
-            prev_idx = (current_idx - 1) % len(tabs)
-            tabbed.active = tabs[prev_idx]
+            self._cycle_tab(-1)
         except Exception:
             pass
 
     def action_next_main_tab(self) -> None:
         """Navigate to next main tab."""
         try:
-            tabbed = self.query_one("#tabs", TabbedContent)
-            tabs = ["setup", "science", "admin", "outputs", "hub", "log", "idea"]
-            current_idx = tabs.index(tabbed.active) if tabbed.active in tabs else 0
-            next_idx = (current_idx + 1) % len(tabs)
-            tabbed.active = tabs[next_idx]
+            self._cycle_tab(1)
         except Exception:
             pass
 
     def action_prev_sub_tab(self) -> None:
         """Navigate to previous sub-tab in current section."""
         try:
-            tabbed = self.query_one("#tabs", TabbedContent)
-            sub_tab_map = {
-                "setup": "#setup_sections",
-                "science": "#science_sections",
-                "admin": "#admin_sections",
-                "outputs": "#outputs_sections",
-                "hub": "#hub_sections",
-            }
-            if tabbed.active in sub_tab_map:
-                sub_tabbed = self.query_one(sub_tab_map[tabbed.active], TabbedContent)
-                tabs = [str(tab.id) for tab in sub_tabbed.query("TabPane")]
-                current_idx = (
-                    tabs.index(sub_tabbed.active) if sub_tabbed.active in tabs else 0
-                )
-                prev_idx = (current_idx - 1) % len(tabs)
-                sub_tabbed.active = tabs[prev_idx]
+            self._cycle_sub_tab(-1)
         except Exception:
             pass
 
     def action_next_sub_tab(self) -> None:
         """Navigate to next sub-tab in current section."""
         try:
-            tabbed = self.query_one("#tabs", TabbedContent)
-            sub_tab_map = {
-                "setup": "#setup_sections",
-                "science": "#science_sections",
-                "admin": "#admin_sections",
-                "outputs": "#outputs_sections",
-                "hub": "#hub_sections",
-            }
-            if tabbed.active in sub_tab_map:
-                sub_tabbed = self.query_one(sub_tab_map[tabbed.active], TabbedContent)
-                tabs = [str(tab.id) for tab in sub_tabbed.query("TabPane")]
-                current_idx = (
-                    tabs.index(sub_tabbed.active) if sub_tabbed.active in tabs else 0
-                )
-                next_idx = (current_idx + 1) % len(tabs)
-                sub_tabbed.active = tabs[next_idx]
+            self._cycle_sub_tab(1)
         except Exception:
             pass
 
     def on_list_view_selected(self, event: ListView.Selected) -> None:
         if event.list_view.id == "active_tasks":
             if event.item and event.item.id:
-                _, idx = event.item.id.split("-", 1)
-                self._selected_active_index = int(idx)
+                idx = event.item.id.rpartition("-")[2]
+                if idx.isdigit():
+                    self._selected_active_index = int(idx)
 
     def _handle_exit_confirm(self, result: str | None) -> None:
         if result == "save":
-            # Save UI state before exiting
-            self._store_ui_state()
+            # The _submit_* paths store UI state themselves right before
+            # exiting, so it is only written once per exit.
             if self._mode == "artifact":
                 self._submit_artifact()
                 return
-            tabbed = self.query_one("#tabs", TabbedContent)
-            if tabbed.active == "init":
+            tabbed = self._main_tabs()
+            if tabbed.active == _TAB_INIT:
                 self._submit_init()
-            elif tabbed.active == "log":
+            elif tabbed.active == _TAB_LOG:
                 self._submit_log()
-            elif tabbed.active == "idea":
+            elif tabbed.active == _TAB_IDEA:
                 self._submit_idea()
-            elif tabbed.active in ("setup", "science", "admin", "outputs", "hub"):
-                # For manifest editing tabs, save and then exit
-                self._save_init()
-                self.exit(None)
             else:
-                # Unknown tab, just exit
+                # For manifest editing tabs, save and then exit; unknown tabs
+                # just exit
+                if tabbed.active in _MANIFEST_EDIT_TABS:
+                    self._save_init()
+                self._store_ui_state()
                 self.exit(None)
         elif result == "discard":
             # Save UI state before exiting
@@ -2093,7 +2007,7 @@ class BAApp(
 
     def _open_directory_picker(self, target_input_id: str) -> None:
         self._browse_target = target_input_id
-        start = Path.home()
+        start = self._home
 
         # Check if input has a current value and use it as starting path
         try:
@@ -2111,7 +2025,9 @@ class BAApp(
         except Exception:
             pass
 
-        self.push_screen(DirectoryPickerScreen(start), self._handle_directory_pick)
+        self.push_screen(
+            screens.DirectoryPickerScreen(start), self._handle_directory_pick
+        )
 
     def _set_archive_browse_enabled(self, enabled: bool) -> None:
         try:
@@ -2194,22 +2110,58 @@ class BAApp(
             else:
                 input_widget = self.query_one(f"#{self._browse_target}", Input)
                 input_widget.value = path
-                self._refresh_init_validation()
+                self._schedule_validation()
                 if self._browse_target == "method_path":
                     self._load_method_preview()
         except Exception:
             pass
         self._browse_target = None
 
+    def watch_project_name_valid(self, valid: bool) -> None:
+        self._set_validation_classes("project_name", valid)
+
+    def watch_analyst_valid(self, valid: bool) -> None:
+        self._set_validation_classes("analyst", valid)
+
+    def _set_validation_classes(self, field_id: str, valid: bool) -> None:
+        widget = self._form_widgets().get(field_id)
+        if widget is None:
+            return
+        widget.set_class(valid, "valid")
+        widget.set_class(not valid, "invalid")
+
     def _refresh_init_validation(self) -> None:
+        """Sync validation state with the current field values.
+
+        Keystrokes are handled by the reactive watchers; this is for mount
+        and bulk form reloads, and applies the classes directly since the
+        watchers do not fire when the value is unchanged.
+        """
+        widgets = self._form_widgets()
         for field_id in ("project_name", "analyst"):
-            widget = self.query_one(f"#{field_id}", Input)
-            widget.remove_class("valid")
-            widget.remove_class("invalid")
-            if widget.value.strip():
-                widget.add_class("valid")
+            valid = bool(widgets[field_id].value.strip())
+            attr = f"{field_id}_valid"
+            if getattr(self, attr) != valid:
+                # The watcher applies the classes
+                setattr(self, attr, valid)
             else:
-                widget.add_class("invalid")
+                self._set_validation_classes(field_id, valid)
+
+    def _schedule_validation(self) -> None:
+        """Coalesce validation refreshes from bulk updates into one pass.
+
+        Setting several inputs queues their Changed events; the flush runs
+        after they have been handled instead of once per field.
+        """
+        if self._validation_timer is None:
+            self._validation_timer = self.set_timer(0.05, self._flush_validation)
+
+    def _flush_validation(self) -> None:
+        self._validation_timer = None
+        try:
+            self._refresh_init_validation()
+        except Exception:
+            pass
 
     def on_data_table_cell_selected(self, event: DataTable.CellSelected) -> None:
         """Handle cell selection (Enter key or click) in collaborators table for inline editing."""
@@ -2264,6 +2216,9 @@ class BAApp(
                         if not hasattr(self, "_task_expanded_ids"):
                             self._task_expanded_ids = set()
                         self._task_expanded_ids.add(str(task_id))
+                        task = self._get_task(task_id)
+                        if task is not None:
+                            self._add_session_nodes(node, task)
         except Exception:
             pass
 
@@ -1,26 +1,161 @@
 from __future__ import annotations
 
+from typing import Iterable, Mapping, Sequence
+
+from textual import events
+from textual.coordinate import Coordinate
 from textual.css.query import NoMatches
+from textual.timer import Timer
+from textual.widgets import DataTable, Input, Select, SelectionList
+from textual.widgets.selection_list import Selection
 
 from textual_datepicker import DateSelect as _DateSelect
 from textual_datepicker import DatePicker
 from textual_datepicker._date_select import DatePickerDialog
 
 
+def sync_table_rows(
+    table: DataTable,
+    rows: Sequence[Sequence[object]],
+    columns: Sequence[str | tuple[str, int]] = (),
+) -> None:
+    """Bring ``table`` in line with ``rows``, touching only what changed.
+
+    Rows are matched by position: existing rows are updated cell by cell,
+    new rows are appended and surplus rows are removed from the end. When
+    exactly one row disappeared, only that row is removed instead of every
+    row below it being shifted up a cell at a time. ``columns`` (labels, or
+    ``(label, width)`` pairs) are added first if the table has none yet.
+    All changes reach the screen in a single repaint.
+
+    Row keys are left to the table, so they do not track positions after a
+    removal; event handlers must resolve rows with ``get_row_index``.
+    """
+    current = table.row_count
+    with table.app.batch_update():
+        if not table.columns:
+            for column in columns:
+                if isinstance(column, tuple):
+                    table.add_column(column[0], width=column[1])
+                else:
+                    table.add_column(column)
+        if len(rows) == current - 1:
+            removed = _removed_row_index(table, rows)
+            if removed is not None:
+                table.remove_row(table.ordered_rows[removed].key)
+                return
+        if not rows:
+            # remove_row re-indexes every remaining row, so drop them in one go
+            table.clear()
+            return
+        for idx in range(min(current, len(rows))):
+            update_table_row(table, idx, rows[idx])
+        table.add_rows(rows[current:])
+        for row in table.ordered_rows[len(rows) :]:
+            table.remove_row(row.key)
+
+
+def update_table_row(table: DataTable, idx: int, cells: Sequence[object]) -> None:
+    """Rewrite the cells of row ``idx`` that differ from ``cells``."""
+    existing = table.get_row_at(idx)
+    with table.app.batch_update():
+        for col, value in enumerate(cells):
+            if existing[col] != value:
+                table.update_cell_at(Coordinate(idx, col), value, update_width=True)
+
+
+def _removed_row_index(
+    table: DataTable, rows: Sequence[Sequence[object]]
+) -> int | None:
+    """Index of the one table row missing from ``rows``, if that is the only change."""
+    idx = 0
+    while idx < len(rows) and table.get_row_at(idx) == list(rows[idx]):
+        idx += 1
+    for later in range(idx, len(rows)):
+        if table.get_row_at(later + 1) != list(rows[later]):
+            return None
+    return idx
+
+
+def table_cells(
+    rows: Iterable[Mapping[str, object]], keys: Sequence[str]
+) -> list[tuple[object, ...]]:
+    """Project row dicts onto ``keys`` in column order, blank for missing keys."""
+    blanks = ("",) * len(keys)
+    return [tuple(map(row.get, keys, blanks)) for row in rows]
+
+
+def select_or_custom(select: Select, custom: Input) -> str:
+    """Return the picked option, or the custom text for "other" or no pick."""
+    value = select.value
+    choice = str(value) if value and value != Select.BLANK else ""
+    text = custom.value.strip()
+    if text and (not choice or choice.lower() == "other"):
+        return text
+    return choice
+
+
+def select_values(
+    selection_list: SelectionList,
+    values: Iterable[str],
+    *,
+    replace: bool = False,
+    add_missing: bool = False,
+) -> None:
+    """Select ``values`` with a single ``SelectedChanged`` instead of one each.
+
+    ``replace`` clears the current selection first; ``add_missing`` appends
+    values the list does not offer yet as pre-selected entries.
+    """
+    before = selection_list.selected
+    wanted = dict.fromkeys(values)
+    known = {
+        selection_list.get_option_at_index(index).value
+        for index in range(selection_list.option_count)
+    }
+    with selection_list.prevent(SelectionList.SelectedChanged):
+        if add_missing:
+            missing = [value for value in wanted if value not in known]
+            if missing:
+                selection_list.add_options(
+                    [Selection(value, value, True) for value in missing]
+                )
+                known.update(missing)
+        if replace:
+            selection_list.deselect_all()
+        for value in wanted:
+            if value in known:
+                selection_list.select(value)
+    if selection_list.selected != before:
+        selection_list.post_message(SelectionList.SelectedChanged(selection_list))
+
+
+class _DatePickerDialog(DatePickerDialog):
+    """Dialog that tells its DateSelect when focus leaving it hides it."""
+
+    def on_descendant_blur(self, event: events.DescendantBlur) -> None:
+        super().on_descendant_blur(event)
+        if not self.display and isinstance(self.target, DateSelect):
+            self.target._dialog_hidden()
+
+
 class DateSelect(_DateSelect):
     _dialog_was_visible = False
     _dialog_mounted = False
+    _dialog_poll: Timer
 
     def on_mount(self) -> None:
         """Override to query within screen context instead of app."""
         # Create dialog early to prevent parent's on_mount from creating one
         if self.dialog is None:
-            self.dialog = DatePickerDialog()
+            self.dialog = _DatePickerDialog()
             self.dialog.target = self
         # Defer actual mounting to ensure mount point exists
         self.call_later(self._mount_dialog)
-        # Start polling for dialog state changes
-        self.set_interval(0.2, self._poll_dialog_state)
+        # Fallback poll for the dialog closing, run only while it is open
+        self._dialog_poll = self.set_interval(
+            0.2, self._poll_dialog_state, pause=True
+        )
 
     def _mount_dialog(self) -> None:
         """Mount the dialog after the screen is fully composed."""
@@ -42,14 +177,22 @@ class DateSelect(_DateSelect):
 
         # Only collapse on transition from visible to hidden
         if self._dialog_was_visible and not is_visible:
-            self._toggle_mount_expanded(False)
+            self._dialog_hidden()
+            return
 
         self._dialog_was_visible = is_visible
 
+    def _dialog_hidden(self) -> None:
+        """Collapse the mount point and stop polling once the dialog closed."""
+        self._dialog_was_visible = False
+        self._toggle_mount_expanded(False)
+        self._dialog_poll.pause()
+
     def _show_date_picker(self) -> None:
         """Override to use screen.query_one instead of app.query_one."""
         mnt_widget = self.screen.query_one(self.picker_mount)
         self.dialog.display = True
+        self._dialog_poll.resume()
 
         # calculate offset of DateSelect and apply it to DatePickerDialog
         self.dialog.offset = self.region.offset - mnt_widget.content_region.offset
@@ -84,7 +227,7 @@ class DateSelect(_DateSelect):
         """Handle date selection - collapse mount after date is picked."""
         super().on_date_picker_selected(event)
         # Collapse after selection
-        self._toggle_mount_expanded(False)
+        self._dialog_hidden()
 
     def on_blur(self) -> None:
         """Collapse mount when DateSelect itself loses focus."""
@@ -9,6 +9,7 @@ from typing import Any, Optional
 
 import yaml
 
+from .config import SafeDumper, SafeLoader
 from .io import dump_manifest, load_manifest
 from .models import (
     LogTaskStatus,
@@ -118,8 +119,9 @@ def load_worklog(project_root: Path) -> WorkLog:
         return WorkLog()
 
     try:
-        with open(worklog_path, "r", encoding="utf-8") as f:
-            data = yaml.safe_load(f) or {}
+        # Hand libyaml the raw bytes; it detects the encoding itself
+        with open(worklog_path, "rb") as f:
+            data = yaml.load(f, Loader=SafeLoader) or {}
 
         worklog = WorkLog.model_validate(data)
 
@@ -173,7 +175,9 @@ def save_worklog(project_root: Path, worklog: WorkLog) -> None:
     data = worklog.model_dump(mode="json", exclude_none=False)
 
     with open(worklog_path, "w", encoding="utf-8") as f:
-        yaml.safe_dump(data, f, sort_keys=False, default_flow_style=False)
+        yaml.dump(
+            data, f, Dumper=SafeDumper, sort_keys=False, default_flow_style=False
+        )
 
     # Update manifest timestamp
     update_worklog_timestamp(project_root)
@@ -0,0 +1,45 @@
+"""Shared fixtures for driving the TUI headlessly."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ba_tui.tui import BAApp
+
+
+@pytest.fixture
+def make_app(tmp_path, monkeypatch):
+    """Return a factory for init-mode apps rooted in ``tmp_path``.
+
+    HOME points into ``tmp_path`` so stored UI state never leaks between tests.
+    """
+    monkeypatch.setenv("HOME", str(tmp_path / "home"))
+
+    def make(**initial_data) -> BAApp:
+        return BAApp(
+            mode="init",
+            recent_entries=[],
+            project_root=tmp_path,
+            project_name="P",
+            analyst="A",
+            initial_data=initial_data,
+        )
+
+    return make
+
+
+@pytest.fixture
+def run_app():
+    """Return a runner that awaits ``scenario(pilot)`` inside ``app.run_test``."""
+
+    def run(app, scenario, size: tuple[int, int] = (160, 50)) -> None:
+        async def main() -> None:
+            async with app.run_test(size=size) as pilot:
+                await pilot.pause()
+                await scenario(pilot)
+
+        asyncio.run(main())
+
+    return run
@@ -0,0 +1,58 @@
+"""DateSelect only polls its dialog while the dialog is open."""
+
+from __future__ import annotations
+
+import pendulum
+from textual.app import App
+from textual.containers import Vertical
+from textual.widgets import Input
+from textual_datepicker import DatePicker
+
+from ba_tui.widgets import DateSelect
+
+
+class _DateApp(App):
+    def compose(self):
+        with Vertical(id="mount"):
+            yield DateSelect(id="date", picker_mount="#mount")
+            yield Input(id="other")
+
+
+def _polling(date_select: DateSelect) -> bool:
+    return date_select._dialog_poll._active.is_set()
+
+
+def test_selection_stops_polling(run_app):
+    app = _DateApp()
+
+    async def scenario(pilot):
+        date_select = app.query_one("#date", DateSelect)
+        assert not _polling(date_select)
+        date_select._show_date_picker()
+        assert _polling(date_select)
+        # Close before the first 0.2 s poll could notice
+        date_select.dialog.date_picker.post_message(
+            DatePicker.Selected(date_select.dialog.date_picker, pendulum.now())
+        )
+        await pilot.pause()
+        assert not date_select.dialog.display
+        assert not _polling(date_select)
+
+    run_app(app, scenario, size=(80, 40))
+
+
+def test_focus_leaving_dialog_stops_polling(run_app):
+    app = _DateApp()
+
+    async def scenario(pilot):
+        date_select = app.query_one("#date", DateSelect)
+        assert not _polling(date_select)
+        date_select._show_date_picker()
+        await pilot.pause()
+        assert _polling(date_select)
+        app.query_one("#other", Input).focus()
+        await pilot.pause()
+        assert not date_select.dialog.display
+        assert not _polling(date_select)
+
+    run_app(app, scenario, size=(80, 40))
@@ -0,0 +1,102 @@
+"""Row selection in the setup/science tables resolves rows by position."""
+
+from __future__ import annotations
+
+from textual.widgets import DataTable, TabbedContent
+
+from ba_tui.screens import AcquisitionSessionModal, ArtifactModal, CollaboratorModal
+
+
+async def _double_select(pilot, table: DataTable, row: int) -> None:
+    table.focus()
+    table.move_cursor(row=row)
+    await pilot.pause()
+    table.action_select_cursor()
+    table.action_select_cursor()
+    await pilot.pause()
+
+
+def test_double_select_opens_collaborator_modal(make_app, run_app):
+    app = make_app(collaborators=[{"name": "Ann"}, {"name": "Bob"}])
+
+    async def scenario(pilot):
+        table = app.query_one("#collaborators_table", DataTable)
+        await _double_select(pilot, table, 1)
+        assert isinstance(app.screen, CollaboratorModal)
+
+    run_app(app, scenario)
+
+
+def test_double_select_opens_modal_after_middle_removal(make_app, run_app):
+    app = make_app(
+        acquisition_sessions=[
+            {"microscope": "A"},
+            {"microscope": "B"},
+            {"microscope": "C"},
+        ],
+    )
+
+    async def scenario(pilot):
+        app.query_one("#tabs", TabbedContent).active = "science"
+        await pilot.pause()
+        app._acquisition_rows.pop(1)
+        app._populate_acquisition_table()
+        table = app.query_one("#acquisition_table", DataTable)
+        await _double_select(pilot, table, 1)
+        assert isinstance(app.screen, AcquisitionSessionModal)
+
+    run_app(app, scenario)
+
+
+def test_highlighting_session_switches_channels(make_app, run_app):
+    app = make_app(
+        acquisition_sessions=[
+            {"microscope": "A", "channels": [{"name": "DAPI"}]},
+            {"microscope": "B", "channels": [{"name": "GFP"}, {"name": "RFP"}]},
+        ],
+    )
+
+    async def scenario(pilot):
+        app.query_one("#tabs", TabbedContent).active = "science"
+        await pilot.pause()
+        table = app.query_one("#acquisition_table", DataTable)
+        table.focus()
+        table.move_cursor(row=0)
+        await pilot.pause()
+        assert [row["name"] for row in app._channel_rows] == ["DAPI"]
+        table.move_cursor(row=1)
+        await pilot.pause()
+        assert [row["name"] for row in app._channel_rows] == ["GFP", "RFP"]
+        assert app._selected_acquisition_index == 1
+
+    run_app(app, scenario)
+
+
+def test_double_select_opens_appended_artifact(make_app, run_app):
+    app = make_app(artifacts=[{"path": "a.tif"}])
+
+    async def scenario(pilot):
+        app._handle_new_artifact({"path": "b.tif", "type": "figure"})
+        await pilot.pause()
+        table = app.query_one("#artifacts_table", DataTable)
+        assert table.row_count == 2
+        await _double_select(pilot, table, 1)
+        assert isinstance(app.screen, ArtifactModal)
+
+    run_app(app, scenario)
+
+
+def test_double_select_opens_appended_rows(make_app, run_app):
+    app = make_app(collaborators=[{"name": "Ann"}])
+
+    async def scenario(pilot):
+        app._handle_new_collaborator({"name": "Bob"})
+        app._handle_new_collaborator({"name": "Cy"})
+        await pilot.pause()
+        table = app.query_one("#collaborators_table", DataTable)
+        assert table.row_count == 3
+        await _double_select(pilot, table, 2)
+        assert isinstance(app.screen, CollaboratorModal)
+        assert app.screen.initial_data["name"] == "Cy"
+
+    run_app(app, scenario)